@@ -2,6 +2,7 @@
 # coding: utf-8
 
 from sage.graphs.graph import Graph
+from sage_widget_adapters.graphs.graph_grid_view_adapter import GraphGridViewAdapter
 
 
 class DominoGeometry:
@@ -93,12 +94,11 @@ class FlippingAztecDiamond(Graph):
         except:
             raise TypeError("We need a positive integer for the graph order.")
         N = 2 * n
-        positions = ((i, j) for i in range(N) for j in range(N) if i - n <= j <= n + i and n - 1 - i <= j <= 3 * n - i - 1)
+        positions = [(i, j) for i in range(N) for j in range(N) if i - n <= j <= n + i and n - 1 - i <= j <= 3 * n - i - 1]
         super(FlippingAztecDiamond, self).__init__(name="Flipping Aztec Diamond Graph of order {}".format(n))
         self.aztec_order = n
         self.add_vertices(positions)
-        self.add_edges((pos,(pos[0],pos[1]+1)) for pos in positions if (pos[0],pos[1]+1) in positions)
-        self.add_edges((pos,(pos[0]+1,pos[1])) for pos in positions if (pos[0]+1,pos[1]) in positions)
+        self.add_edges(GraphGridViewAdapter.grid_edges(positions))
         try:
             for t in matching:
                 assert (t[0][0] == t[1][0] and (t[0][1] + 1 == t[1][1] or t[0][1] == t[1][1] + 1) or \
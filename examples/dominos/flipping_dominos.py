@@ -5,7 +5,7 @@ from .flipping_aztecdiamond import *
 from sage_widget_adapters.graphs.graph_grid_view_adapter import GraphGridViewAdapter
 from sage_combinat_widgets.grid_view_widget import GridViewWidget, ButtonCell, BlankButton, styled_button_cell
 from ipywidgets import Layout
-from traitlets import dlink, HasTraits, Bool, observe, All
+from traitlets import dlink, HasTraits, Bool
 from contextlib import contextmanager
 from sage_combinat_widgets.grid_view_editor import extract_coordinates
 
@@ -58,8 +58,10 @@ class Domino(object):
 
     def __init__(self, parent, b1, b2, link=True):
         """A domino has a parent widget and is made of 2 buttons"""
-        b1.link = None
-        b2.link = None
+        for b in (b1, b2):
+            if getattr(b, 'link', None):
+                b.link.unlink() # Button kept from a former domino
+            b.link = None
         b1.value = False
         b2.value = False
         super(Domino, self).__init__()
@@ -124,14 +126,12 @@ class Domino(object):
 
     def reset(self):
         """Full domino unlink"""
-        self.first.link.unlink()
-        self.first.link = None
-        del self.first.link
-        self.first.value = False
-        self.second.link.unlink()
-        self.second.link = None
-        del self.second.link
-        self.second.value = False
+        for b in self.buttons:
+            if getattr(b, 'link', None):
+                b.link.unlink()
+            b.link = None
+            del b.link
+            b.value = False
 
     def flip(self, other):
         """Flip self with some neighboring domino"""
@@ -173,7 +173,11 @@ class FlippingDominosWidget(GridViewWidget):
                                             cell_widget_class_index=make_cell_widget_class_index(g),
                                             blank_widget_class = BlankButton)
 
-    def draw(self):
+    def draw(self, changed=None):
+        """Dominos span rows: draw the whole grid
+        and match it again"""
+        for d in getattr(self, 'dominos', {}).values():
+            d.reset()
         self.dominos = {}
         super(FlippingDominosWidget, self).draw()
         self.apply_matching(self.value.matching)
@@ -213,7 +217,6 @@ class FlippingDominosWidget(GridViewWidget):
             if t in self.dominos:
                 return self.dominos[t]
 
-    @observe(All)
     def set_cell(self, change):
         if self.donottrack:
             return
@@ -0,0 +1,161 @@
+// Copyright (c) Odile Bénassy, Nicolas Thiéry
+// Distributed under the terms of the Modified BSD License.
+
+import { DOMWidgetModel, DOMWidgetView } from '@jupyter-widgets/base';
+import { MODULE_NAME, MODULE_VERSION } from './version';
+
+export
+class CompactGridViewModel extends DOMWidgetModel {
+    defaults() {
+        return {...super.defaults(),
+	_model_name: 'CompactGridViewModel',
+	_model_module: MODULE_NAME,
+	_model_module_version: MODULE_VERSION,
+	_view_name: 'CompactGridViewView',
+	_view_module: MODULE_NAME,
+	_view_module_version: MODULE_VERSION,
+	_grid: [],
+	_classes: [],
+	_addable: [],
+	_removable: [],
+	_dirty: {},
+	_pending: [],
+	_buffer: null,
+	_dtype: '',
+	_shape: [],
+	cell_kind: 'text',
+	display_convention: 'en',
+	disable_unremovable: false,
+        };
+    }
+}
+
+export
+class CompactGridViewView extends DOMWidgetView {
+    render() {
+        super.render();
+        this.el.classList.add('compactgrid');
+        this.update_grid();
+        this.model.on('change:_grid change:_classes change:_addable change:_removable', this.update_grid, this);
+        this.model.on('change:_buffer change:_dtype change:_shape', this.update_grid, this);
+        this.model.on('change:cell_kind change:display_convention change:disable_unremovable', this.update_grid, this);
+        this.model.on('change:_dirty change:_pending', this.update_dirty, this);
+    }
+
+    update_grid() {
+        while (this.el.firstChild) this.el.removeChild(this.el.firstChild);
+        let grid = this.model.get('_grid') || [];
+        if (this.model.get('_dtype')) grid = this.buffer_grid();
+        let rows: HTMLElement[] = [];
+        for (let i = 0; i < grid.length; i++) {
+            let row = document.createElement('div');
+            row.className = 'compactgrid-row';
+            for (let j = 0; j < grid[i].length; j++) {
+                row.appendChild(this.make_cell(i, j, grid[i][j]));
+            }
+            rows.push(row);
+        }
+        if (this.model.get('display_convention') == 'fr') rows.reverse();
+        for (let row of rows) this.el.appendChild(row);
+        this.update_dirty();
+    }
+
+    buffer_grid(): string[][] {
+        // Decode the packed little-endian buffer into rows of display strings
+        let dtype = this.model.get('_dtype');
+        let shape = this.model.get('_shape');
+        let data: DataView = this.model.get('_buffer');
+        let n = shape[0] * shape[1];
+        let read_int = (k: number) => {
+            let lo = data.getUint32(8 * k, true);
+            let hi = data.getInt32(8 * k + 4, true);
+            return hi * 4294967296 + lo;
+        };
+        let grid: string[][] = [];
+        for (let i = 0; i < shape[0]; i++) {
+            let row: string[] = [];
+            for (let j = 0; j < shape[1]; j++) {
+                let k = i * shape[1] + j;
+                if (dtype == 'float64') {
+                    row.push(String(data.getFloat64(8 * k, true)));
+                } else if (dtype == 'rational') {
+                    let den = read_int(n + k);
+                    row.push(den == 1 ? String(read_int(k)) : read_int(k) + '/' + den);
+                } else {
+                    row.push(String(read_int(k)));
+                }
+            }
+            grid.push(row);
+        }
+        return grid;
+    }
+
+    mask_value(name: string, i: number, j: number): any {
+        let mask = this.model.get(name) || [];
+        if (i < mask.length && j < mask[i].length) return mask[i][j];
+        return null;
+    }
+
+    make_cell(i: number, j: number, value: any): HTMLElement {
+        let el: HTMLElement;
+        let addable = this.mask_value('_addable', i, j);
+        let removable = this.mask_value('_removable', i, j);
+        if (value === null) {
+            el = document.createElement('span');
+            el.className = 'compactgrid-blank';
+        } else if (this.model.get('cell_kind') == 'button') {
+            let button = document.createElement('button');
+            button.className = 'compactgrid-button';
+            if (addable) {
+                button.classList.add('addablebutton');
+                button.textContent = '+';
+                button.title = 'Click to add a cell here';
+            } else {
+                if (removable) button.textContent = '-';
+                else if (this.model.get('disable_unremovable')) button.disabled = true;
+                button.title = i + ', ' + j;
+            }
+            button.addEventListener('click', () => {
+                this.send({event: 'edit', op: addable ? 'add' : 'set', pos: [i, j], value: true});
+            });
+            el = button;
+        } else {
+            let input = document.createElement('input');
+            input.type = 'text';
+            input.className = 'compactgrid-cell';
+            input.value = value;
+            if (addable) input.classList.add('addablecell');
+            if (removable) input.classList.add('removablecell');
+            input.addEventListener('change', () => {
+                if (this.model.get('_dtype')) {
+                    this.send({event: 'edit', index: i * this.model.get('_shape')[1] + j, value: input.value});
+                } else {
+                    this.send({event: 'edit', op: addable ? 'add' : 'set', pos: [i, j], value: input.value});
+                }
+            });
+            el = input;
+        }
+        let cls = this.mask_value('_classes', i, j);
+        if (cls) el.classList.add(cls);
+        el.dataset.pos = i + ',' + j;
+        return el;
+    }
+
+    update_dirty() {
+        let dirty = this.model.get('_dirty') || {};
+        let pending = this.model.get('_pending') || [];
+        let cells = this.el.querySelectorAll('[data-pos]');
+        for (let k = 0; k < cells.length; k++) {
+            let el = cells[k] as HTMLElement;
+            let pos = el.dataset.pos as string;
+            el.classList.toggle('pending', pending.indexOf(pos) >= 0);
+            if (pos in dirty) {
+                el.classList.add('dirty');
+                el.title = dirty[pos];
+            } else if (el.classList.contains('dirty')) {
+                el.classList.remove('dirty');
+                el.removeAttribute('title');
+            }
+        }
+    }
+};
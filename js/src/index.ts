@@ -4,3 +4,4 @@
 import '../style/sage-combinat-widgets.css';
 export * from './version';
 export * from './singleton_widgets';
+export * from './compact_grid_view_widget';
@@ -13,7 +13,8 @@ import {
   IJupyterWidgetRegistry
  } from '@jupyter-widgets/base';
 
-import * as widgetExports from './singleton_widgets';
+import * as singletonExports from './singleton_widgets';
+import * as compactGridExports from './compact_grid_view_widget';
 
 import {
   MODULE_NAME, MODULE_VERSION
@@ -41,6 +42,6 @@ function activateWidgetExtension(app: Application<Widget>, registry: IJupyterWid
   registry.registerWidget({
     name: MODULE_NAME,
     version: MODULE_VERSION,
-    exports: widgetExports,
+    exports: {...singletonExports, ...compactGridExports},
   });
 }
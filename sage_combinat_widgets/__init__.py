@@ -1,5 +1,46 @@
 from __future__ import print_function, absolute_import
+import sys
+from importlib import import_module
 # Add the import for which you want to give a direct access
 from .grid_view_editor import GridViewEditor
-from .grid_view_widget import BlankCell, DisabledButtonCell, BlankButton, styled_button_cell, styled_push_button, GridViewWidget
+from .grid_view_engine import GridViewEngine
 from sage_widget_adapters import *
+
+# Widgets need ipywidgets: they are imported on first access,
+# so that headless use of the engine does not load it.
+_widget_modules = {
+    'BlankCell': 'grid_view_widget',
+    'DisabledButtonCell': 'grid_view_widget',
+    'BlankButton': 'grid_view_widget',
+    'styled_button_cell': 'grid_view_widget',
+    'styled_push_button': 'grid_view_widget',
+    'GridViewWidget': 'grid_view_widget',
+    'CompactGridViewWidget': 'compact_grid_view_widget',
+}
+
+def __getattr__(name):
+    r"""
+    Import widget classes on first access (see PEP 562).
+
+    TESTS ::
+
+        sage: import subprocess, sys
+        sage: code = "import sage_combinat_widgets.grid_view_engine, sys; print('ipywidgets' in sys.modules)"
+        sage: subprocess.check_output([sys.executable, '-c', code]).decode().strip()
+        'False'
+        sage: from sage_combinat_widgets import GridViewWidget
+        sage: GridViewWidget.__module__
+        'sage_combinat_widgets.grid_view_widget'
+    """
+    if name not in _widget_modules:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(import_module('.' + _widget_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+if sys.version_info < (3, 7): # No module __getattr__
+    try:
+        for _name in _widget_modules:
+            globals()[_name] = __getattr__(_name)
+    except ImportError: # Headless use, without ipywidgets
+        pass
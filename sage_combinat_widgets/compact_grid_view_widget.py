@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+r"""
+A compact Grid View Widget for Sage Jupyter Notebook.
+
+Unlike :class:`~sage_combinat_widgets.grid_view_widget.GridViewWidget`,
+which builds one singleton widget per cell, this widget is backed
+by a single frontend model. The whole grid -- cell display values,
+CSS classes, addable and removable masks -- is synced as arrays
+and rendered client-side. Edits come back as custom messages.
+
+EXAMPLES ::
+
+    sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+    sage: t = StandardTableau([[1, 2, 5, 6], [3], [4]])
+    sage: w = CompactGridViewWidget(t)
+    sage: w._grid
+    [['1', '2', '5', '6', ''], ['3', ''], ['4'], ['']]
+    sage: w._addable
+    [[0, 0, 0, 0, 1], [0, 1], [0], [1]]
+    sage: w._removable
+    [[0, 0, 0, 1, 0], [0, 0], [1], [0]]
+
+AUTHORS ::
+
+    Odile Bénassy, Nicolas Thiéry
+
+"""
+from .grid_view_editor import GridViewEditor
+from .grid_view_widget import get_model_id
+from ipywidgets import DOMWidget, ValueWidget, register
+from traitlets import Bool, Bytes, Dict, List, Unicode
+from singleton_widgets import JS_VERSION
+from six import text_type
+
+
+@register
+class CompactGridViewWidget(GridViewEditor, DOMWidget, ValueWidget):
+    r"""
+    A single-model widget for all grid-representable Sage objects.
+
+    Cell values are synced in trait `_grid` as a list of rows,
+    with `None` for blank positions. Traits `_addable` and `_removable`
+    have the same shape, and so does `_classes` when there are CSS classes
+    (it is empty otherwise).
+
+    The editor works in patch mode: there are no individual cell traits.
+
+    With `transport='buffer'`, numeric matrices are instead synced
+    as one packed binary buffer `_buffer`, with element type `_dtype`
+    and shape `_shape`. Edits then come back as flat index/value pairs.
+    """
+    _model_name = Unicode('CompactGridViewModel').tag(sync=True)
+    _model_module = Unicode('sage-combinat-widgets').tag(sync=True)
+    _model_module_version = Unicode(JS_VERSION).tag(sync=True)
+    _view_name = Unicode('CompactGridViewView').tag(sync=True)
+    _view_module = Unicode('sage-combinat-widgets').tag(sync=True)
+    _view_module_version = Unicode(JS_VERSION).tag(sync=True)
+    _grid = List().tag(sync=True)
+    _classes = List().tag(sync=True)
+    _addable = List().tag(sync=True)
+    _removable = List().tag(sync=True)
+    _dirty = Dict().tag(sync=True)
+    _pending = List().tag(sync=True)
+    _buffer = Bytes().tag(sync=True)
+    _dtype = Unicode('').tag(sync=True)
+    _shape = List().tag(sync=True)
+    cell_kind = Unicode('text').tag(sync=True)
+    display_convention = Unicode('en').tag(sync=True)
+    disable_unremovable = Bool(False).tag(sync=True)
+    cell_traits = False
+
+    def __init__(self, obj, adapter=None, display_convention='en', cell_kind=None,
+                 css_classes=[], css_class_index=None, disable_unremovable=False, transport='grid'):
+        r"""
+        Compact Grid View Widget initialization.
+
+        INPUT:
+            - ``cell_kind``: either 'text' or 'button' (by default: 'button' for boolean cells)
+            - ``css_classes``: a list of CSS classes for the cells
+            - ``css_class_index``: a function from positions to indices in `css_classes`
+            - ``disable_unremovable``: whether button cells that are not removable should be disabled
+            - ``transport``: either 'grid' or 'buffer' -- the latter for numeric matrices only
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: from sage.graphs.generators.families import AztecDiamondGraph
+            sage: w = CompactGridViewWidget(AztecDiamondGraph(2))
+            sage: w.cell_kind
+            'button'
+            sage: w._grid
+            [[None, False, False], [False, False, False, False], [False, False, False, False], [None, False, False]]
+            sage: w = CompactGridViewWidget(matrix(QQ, 2, 2, [1/2, 0, 0, 1]))
+            sage: w.cell_kind
+            'text'
+            sage: w._grid
+            [['1/2', '0'], ['0', '1']]
+            sage: w = CompactGridViewWidget(matrix(RDF, 200, 200, range(40000)), transport='buffer')
+            sage: w._dtype, w._shape, len(w._buffer), w._grid
+            ('float64', [200, 200], 320000, [])
+        """
+        GridViewEditor.__init__(self, obj, adapter)
+        DOMWidget.__init__(self)
+        self._model_id = get_model_id(self)
+        self.description = "Compact grid view widget for Jupyter notebook, for object '%s'" % obj
+        self.display_convention = display_convention
+        if not cell_kind:
+            if self.adapter.celltype is bool:
+                cell_kind = 'button'
+            else:
+                cell_kind = 'text'
+        self.cell_kind = cell_kind
+        if cell_kind == 'button':
+            self.displaytype = bool
+        else:
+            self.displaytype = text_type
+        self.disable_unremovable = disable_unremovable
+        self.transport = transport
+        self.css_classes = css_classes
+        self.css_class_index = css_class_index or (lambda x:0)
+        self.cast = lambda x:self.adapter.display_to_cell(x, self.displaytype)
+        self.on_msg(self._handle_msg)
+        self.draw()
+        self.donottrack = False
+
+    def batch(self):
+        r"""
+        A context where state updates of the widget
+        are held, then sent as one message on exit.
+        """
+        return self.hold_sync()
+
+    def to_cell(self, val):
+        r"""
+        From a widget cell value `val`,
+        return a valid editor cell value.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(StandardTableaux(5).random_element())
+            sage: w.to_cell('3')
+            3
+        """
+        return self.cast(val)
+
+    def display_value(self, pos):
+        r"""
+        Return the display value of the cell at position `pos`,
+        as sent to the frontend.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(Partition([2, 1]))
+            sage: w.display_value((0, 1))
+            False
+        """
+        val = self.adapter.cell_to_display(self.cells.get(pos, self.adapter.cellzero), self.displaytype)
+        if self.displaytype is bool:
+            return bool(val)
+        return text_type(val)
+
+    def compute_classes(self, css_classes=None, css_class_index=None):
+        r"""
+        Compute the CSS class array, with the same shape as the grid.
+        Without CSS classes, this is an empty array:
+        the frontend reads missing entries as no class.
+        """
+        if not css_classes:
+            css_classes = self.css_classes
+        if not css_classes:
+            return []
+        if not css_class_index:
+            css_class_index = self.css_class_index
+        index = self.index
+        classes = []
+        for i in range(index.total_height):
+            classes.append([css_classes[css_class_index((i,j))] if index.kind((i,j)) != 'blank' else ''
+                            for j in range(index.width(i))])
+        return classes
+
+    def update_style(self, css_classes=None, css_class_index=None):
+        r"""
+        Update look and feel -- ie CSS classes.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(Partition([2, 1]))
+            sage: w.update_style(css_classes=['cl0', 'cl1'], css_class_index=lambda x:x[0]%2)
+            sage: w._classes
+            [['cl0', 'cl0', 'cl0'], ['cl1', 'cl1'], ['cl0']]
+        """
+        if css_classes:
+            self.css_classes = css_classes
+        if css_class_index:
+            self.css_class_index = css_class_index
+        self._classes = self.compute_classes()
+
+    def draw(self, changed=None):
+        r"""
+        Compute the grid arrays and sync them to the frontend,
+        as one state update for the whole grid.
+        Changed rows `changed` are ignored: arrays are synced whole.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(SkewPartition([[3, 1], [1]]))
+            sage: w._grid
+            [[False, False, False, False], [False, False], [False]]
+            sage: w._addable
+            [[1, 0, 0, 1], [0, 1], [1]]
+        """
+        self.donottrack = True
+        self.compute_height()
+        if self.transport == 'buffer' and self.draw_buffer():
+            self.donottrack = False
+            return
+        index = self.index
+        if self.displaytype is bool:
+            addable_display = False
+        else:
+            addable_display = ''
+        displays = {}
+        if self.displaytype is text_type and hasattr(self.adapter, 'display_cells'): # All at once
+            displays = self.adapter.display_cells(self.value, self.displaytype)
+        grid, addable_mask, removable_mask = [], [], []
+        for i in range(index.total_height):
+            row = index.rows.get(i, {})
+            grid_row, addable_row, removable_row = [], [], []
+            for j in range(index.width(i)):
+                pos = (i,j)
+                if pos in displays:
+                    grid_row.append(displays[pos])
+                elif j in row:
+                    grid_row.append(self.display_value(pos))
+                elif pos in index.addable:
+                    grid_row.append(addable_display)
+                elif index.kind(pos) == 'zero': # Sparse grids
+                    grid_row.append(self.display_value(pos))
+                else:
+                    grid_row.append(None)
+                addable_row.append(int(pos in index.addable))
+                removable_row.append(int(pos in index.removable))
+            grid.append(grid_row)
+            addable_mask.append(addable_row)
+            removable_mask.append(removable_row)
+        with self.batch():
+            self._grid = grid
+            self._addable = addable_mask
+            self._removable = removable_mask
+            self._classes = self.compute_classes()
+            self._dirty = {}
+            if self._dtype:
+                self._dtype = ''
+                self._buffer = b''
+        self.donottrack = False
+
+    def draw_buffer(self):
+        r"""
+        Sync the grid as one packed binary buffer, if the adapter can pack it.
+        Return whether it could.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(matrix(ZZ, 2, 3, range(6)), transport='buffer')
+            sage: w._dtype, w._shape, len(w._buffer)
+            ('int64', [2, 3], 48)
+            sage: w._classes
+            []
+            sage: w = CompactGridViewWidget(matrix(ZZ, 1, 3, range(3)), transport='buffer')
+            sage: w._dtype, w._grid
+            ('', [['0', '1', '2', '']])
+        """
+        if not hasattr(self.adapter, 'to_buffer') or self.index.addable:
+            return False # Addable cells need the grid transport
+        packed = self.adapter.to_buffer(self.value)
+        if not packed:
+            return False
+        dtype, buf = packed
+        with self.batch():
+            self._grid = []
+            self._addable = []
+            self._removable = []
+            self._classes = self.compute_classes()
+            self._dirty = {}
+            self._shape = [self.value.nrows(), self.value.ncols()]
+            self._dtype = dtype
+            self._buffer = buf
+        return True
+
+    def _handle_msg(self, widget, content, buffers):
+        r"""
+        Handle an edit message from the frontend,
+        as a patch `(op, pos, value)` to the editor.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: w._handle_msg(w, {'event': 'edit', 'op': 'set', 'pos': [0, 2], 'value': '7'}, [])
+            sage: w.value
+            [[1, 2, 7, 6], [3], [4]]
+            sage: w._grid[0]
+            ['1', '2', '7', '6', '']
+            sage: w._handle_msg(w, {'event': 'edit', 'op': 'add', 'pos': [1, 1], 'value': '8'}, [])
+            sage: w.value
+            [[1, 2, 7, 6], [3, 8], [4]]
+            sage: hasattr(w, 'cell_0_0')
+            False
+            sage: w = CompactGridViewWidget(matrix(QQ, 2, 2, [1/2, 0, 0, 1]), transport='buffer')
+            sage: w._handle_msg(w, {'event': 'edit', 'index': 1, 'value': '2/3'}, [])
+            sage: w.value
+            [1/2 2/3]
+            [  0   1]
+        """
+        if content.get('event') != 'edit':
+            return
+        if 'index' in content: # Buffer transport
+            pos = divmod(content['index'], self._shape[1])
+            self.apply_patch('set', pos, text_type(content.get('value')))
+            return
+        pos = tuple(content['pos'])
+        op = content.get('op')
+        if not op:
+            if pos in self.cells:
+                op = 'set'
+            else:
+                op = 'add'
+        self.apply_patch(op, pos, content.get('value'))
+
+    def set_pending(self, pos):
+        r"""
+        Mark cell #pos as waiting for validation.
+        """
+        super(CompactGridViewWidget, self).set_pending(pos)
+        self._pending = ['%d,%d' % p for p in sorted(self.pending)]
+
+    def unset_pending(self, pos):
+        r"""
+        Cell #pos is no more waiting for validation.
+        """
+        self._pending = ['%d,%d' % p for p in sorted(self.pending) if p != pos]
+
+    def set_dirty(self, pos, val, err=None):
+        r"""
+        Set cell #pos as dirty
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.compact_grid_view_widget import CompactGridViewWidget
+            sage: w = CompactGridViewWidget(StandardTableau([[1, 2, 5, 6], [3], [4]]))
+            sage: w._handle_msg(w, {'event': 'edit', 'op': 'set', 'pos': [0, 2], 'value': '7'}, [])
+            sage: w.dirty
+            {(0, 2): 7}
+            sage: w._dirty
+            {'0,2': 'the entries in each row of a semistandard tableau must be weakly increasing'}
+        """
+        super(CompactGridViewWidget, self).set_dirty(pos, val, err)
+        dirty = dict(self._dirty)
+        dirty['%d,%d' % pos] = self.dirty_info(pos)
+        self._dirty = dirty
+
+    def unset_dirty(self, pos):
+        r"""
+        Set a cell no more 'dirty'.
+        """
+        super(CompactGridViewWidget, self).unset_dirty(pos)
+        dirty = dict(self._dirty)
+        dirty.pop('%d,%d' % pos, None)
+        self._dirty = dirty
+
+    def reset_dirty(self):
+        r"""
+        Reset all previously 'dirty' cells.
+        """
+        super(CompactGridViewWidget, self).reset_dirty()
+        if self._dirty:
+            self._dirty = {}
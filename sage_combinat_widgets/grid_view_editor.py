@@ -24,11 +24,24 @@ AUTHORS ::
 import re, traitlets
 from six import add_metaclass
 from abc import abstractmethod
-from copy import copy
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from sage.misc.bindable_class import BindableClass
 from sage.all import SageObject
+from sage.graphs.generic_graph import GenericGraph
 from sage.misc.abstract_method import AbstractMethod
-MAX_LEN_HISTORY = 50
+from sage_widget_adapters.registry import adapter_class
+from sage_widget_adapters.generic_grid_view_adapter import DirtyOverlay
+from .history import EditHistory, CellDelta, Snapshot, ABSENT, diff_cells, DEFAULT_HISTORY_BUDGET
+try:
+    from tornado.ioloop import IOLoop
+except ImportError:
+    IOLoop = None
+MAX_TRAIT_CLASSES = 64
+_trait_classes = OrderedDict() # Dynamically generated trait classes, in LRU order
+
+_coordinates_pattern = re.compile('_([0-9]+)_([0-9]+)')
 
 def extract_coordinates(s):
     r"""
@@ -40,14 +53,24 @@ def extract_coordinates(s):
         sage: extract_coordinates('add_0_4')
         (0, 4)
     """
-    patt = re.compile('_([0-9]+)_([0-9]+)')
-    m = patt.search(s)
+    m = _coordinates_pattern.search(s)
     if m:
         return tuple(int(i) for i in m.groups())
 
+_validation_executor = None
+def default_validation_executor():
+    r"""
+    Return the thread pool shared by editors in asynchronous validation mode.
+    """
+    global _validation_executor
+    if _validation_executor is None:
+        _validation_executor = ThreadPoolExecutor(max_workers=1)
+    return _validation_executor
+
 def get_adapter(obj):
     r"""
-    Return an adapter object for Sage object `obj`.
+    Return an adapter object for Sage object `obj`,
+    from the adapter registry, or ``None``.
 
     INPUT:
 
@@ -69,44 +92,167 @@ def get_adapter(obj):
         sage: ta.cellzero
         0
     """
-    from sage.combinat.partition import Partition
-    if issubclass(obj.__class__, Partition):
-        from sage_widget_adapters.combinat.partition_grid_view_adapter import PartitionGridViewAdapter
-        return PartitionGridViewAdapter()
-    from sage.combinat.skew_partition import SkewPartition
-    if issubclass(obj.__class__, SkewPartition):
-        from sage_widget_adapters.combinat.skew_partition_grid_view_adapter import SkewPartitionGridViewAdapter
-        return SkewPartitionGridViewAdapter()
-    from sage.combinat.tableau import Tableau
-    if issubclass(obj.__class__, Tableau):
-        from sage.combinat.tableau import SemistandardTableau, StandardTableau
-        if issubclass(obj.__class__, StandardTableau):
-            from sage_widget_adapters.combinat.tableau_grid_view_adapter import StandardTableauGridViewAdapter
-            return StandardTableauGridViewAdapter()
-        if issubclass(obj.__class__, SemistandardTableau):
-            from sage_widget_adapters.combinat.tableau_grid_view_adapter import SemistandardTableauGridViewAdapter
-            return SemistandardTableauGridViewAdapter()
-        from sage_widget_adapters.combinat.tableau_grid_view_adapter import TableauGridViewAdapter
-        return TableauGridViewAdapter()
-    from sage.combinat.skew_tableau import SkewTableau
-    if issubclass(obj.__class__, SkewTableau):
-        from sage_widget_adapters.combinat.skew_tableau_grid_view_adapter import SkewTableauGridViewAdapter
-        return SkewTableauGridViewAdapter()
+    cls = adapter_class(obj.__class__)
+    if cls:
+        return cls.for_object(obj)
+
+class CellIndex(object):
+    r"""
+    A row-bucketed index of grid cells,
+    with set-backed addable and removable positions
+    and per-row extents.
+    For sparse grids, `shape` is the pair (number of rows, number of columns):
+    positions inside it that are not in `cells` are zero cells.
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.grid_view_editor import CellIndex
+        sage: idx = CellIndex({(0,0): 1, (0,1): 2, (1,0): 3}, addable=[(0,2), (1,1), (2,0)], removable=[(0,1), (1,0)])
+        sage: idx.rows
+        {0: {0: 1, 1: 2}, 1: {0: 3}}
+        sage: idx.height, idx.total_height
+        (2, 3)
+        sage: idx.width(0), idx.width(2), idx.width(3)
+        (3, 1, 0)
+        sage: idx.kind((0,2)), idx.kind((1,0)), idx.kind((1,4))
+        ('addable', 'cell', 'blank')
+        sage: idx.is_removable((1,0))
+        True
+        sage: idx = CellIndex({(1,2): 5}, shape=(3, 4))
+        sage: idx.height, idx.width(0), idx.kind((0,0)), idx.kind((1,2)), idx.kind((3,0))
+        (3, 4, 'zero', 'cell', 'blank')
+    """
+    def __init__(self, cells, addable=[], removable=[], shape=None):
+        self.shape = shape
+        self.rows = {}
+        self.addable_rows = {}
+        self.extents = {}
+        self.addable_list = list(addable) # Keep adapter order
+        self.addable = set(self.addable_list)
+        self.removable = set(removable)
+        for (i,j), val in cells.items():
+            self.rows.setdefault(i, {})[j] = val
+            if j >= self.extents.get(i, 0):
+                self.extents[i] = j + 1
+        self.height = max(self.rows) + 1 if self.rows else 0
+        if shape:
+            self.height = max(self.height, shape[0])
+            for i in range(shape[0]):
+                self.extents[i] = max(self.extents.get(i, 0), shape[1])
+        self.total_height = self.height
+        for (i,j) in self.addable_list:
+            self.addable_rows.setdefault(i, set()).add(j)
+            if j >= self.extents.get(i, 0):
+                self.extents[i] = j + 1
+            if i >= self.total_height:
+                self.total_height = i + 1
+
+    def update(self, cells, positions, addable=[], removable=[]):
+        r"""
+        Update the index in place, for new cells dictionary `cells`
+        where only `positions` changed, and new addable and removable cells.
+        Return the set of rows that changed, addable or removable cells included.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_editor import CellIndex
+            sage: idx = CellIndex({(0,0): 1, (0,1): 2, (1,0): 3}, addable=[(0,2), (1,1), (2,0)], removable=[(0,1), (1,0)])
+            sage: sorted(idx.update({(0,0): 1, (0,1): 2}, [(1,0)], addable=[(0,2), (1,0)], removable=[(0,1)]))
+            [1, 2]
+            sage: idx.rows, idx.height, idx.total_height, idx.width(1), idx.width(2)
+            ({0: {0: 1, 1: 2}}, 1, 2, 1, 0)
+        """
+        rows = set()
+        for pos in positions:
+            i, j = pos
+            rows.add(i)
+            if pos in cells:
+                self.rows.setdefault(i, {})[j] = cells[pos]
+            elif i in self.rows:
+                self.rows[i].pop(j, None)
+                if not self.rows[i]:
+                    del self.rows[i]
+        addable_list = list(addable)
+        addable_set = set(addable_list)
+        removable_set = set(removable)
+        rows.update(pos[0] for pos in self.addable ^ addable_set)
+        rows.update(pos[0] for pos in self.removable ^ removable_set)
+        self.addable_list, self.addable, self.removable = addable_list, addable_set, removable_set
+        self.addable_rows = {}
+        for (i,j) in addable_list:
+            self.addable_rows.setdefault(i, set()).add(j)
+        for i in rows:
+            width = max(self.rows[i]) + 1 if i in self.rows else 0
+            if i in self.addable_rows:
+                width = max(width, max(self.addable_rows[i]) + 1)
+            if self.shape and i < self.shape[0]:
+                width = max(width, self.shape[1])
+            if width:
+                self.extents[i] = width
+            else:
+                self.extents.pop(i, None)
+        self.height = max(self.rows) + 1 if self.rows else 0
+        if self.shape:
+            self.height = max(self.height, self.shape[0])
+        self.total_height = max([self.height] + [i + 1 for i in self.addable_rows])
+        return rows
+
+    def width(self, i):
+        r"""
+        Return the number of grid positions in row `i`,
+        addable cells included.
+        """
+        return self.extents.get(i, 0)
+
+    def kind(self, pos):
+        r"""
+        Return 'cell', 'addable', 'zero' or 'blank' for position `pos`.
+        """
+        if pos[1] in self.rows.get(pos[0], ()):
+            return 'cell'
+        if pos in self.addable:
+            return 'addable'
+        if self.shape and pos[0] < self.shape[0] and pos[1] < self.shape[1]:
+            return 'zero'
+        return 'blank'
+
+    def is_removable(self, pos):
+        r"""
+        Is position `pos` a removable cell?
+        """
+        return pos in self.removable
+
+def changed_positions(old_cells, new_cells):
+    r"""
+    Return the set of positions where cells dictionaries
+    `old_cells` and `new_cells` differ, or ``None``
+    if cell values cannot be compared that way (not hashable).
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.grid_view_editor import changed_positions
+        sage: sorted(changed_positions({(0,0): 1, (0,1): 2}, {(0,0): 1, (0,1): 3, (1,0): 4}))
+        [(0, 1), (1, 0)]
+        sage: changed_positions({(0,0): [1]}, {(0,0): [2]}) is None
+        True
+    """
     try:
-        from sage.combinat.parallelogram_polyomino import ParallelogramPolyomino
-        if issubclass(obj.__class__, ParallelogramPolyomino):
-            from sage_widget_adapters.combinat.parallelogram_polyomino_grid_view_adapter import ParallelogramPolyominoGridViewAdapter
-            return ParallelogramPolyominoGridViewAdapter()
-    except:
-        pass # support for parallelogram polyomino appears only in Sage 8.9
-    from sage.matrix.matrix2 import Matrix
-    if issubclass(obj.__class__, Matrix):
-        from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
-        return MatrixGridViewAdapter(obj)
-    from sage.graphs.graph import Graph
-    if issubclass(obj.__class__, Graph):
-        from sage_widget_adapters.graphs.graph_grid_view_adapter import GraphGridViewAdapter
-        return GraphGridViewAdapter()
+        return set(pos for pos, val in old_cells.items() ^ new_cells.items())
+    except TypeError:
+        return None
+
+def _zero_key(val):
+    r"""
+    A hashable key for cell zero value `val`,
+    telling apart equal values of different types (eg 0 and False).
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.grid_view_editor import _zero_key
+        sage: _zero_key(0) == _zero_key(False)
+        False
+    """
+    return (type(val), repr(val))
 
 class cdlink(traitlets.dlink):
     def __repr__(self):
@@ -131,6 +277,12 @@ class GridViewEditor(BindableEditorClass):
     with coordinates (row_number, cell_number_in_row) as keys
     """
     value = traitlets.Any()
+    cell_traits = True # Set to False for patch mode: no cell traits, edits go through `apply_patch`
+    viewport = None # (row0, col0, nrows, ncols) or None for the whole grid
+    _trait_routes = {} # Cell trait name -> ('cell' or 'add', position), set by `compute_traits`
+    _trait_rows = None # Row -> set of cell trait names, set by `compute_traits`
+    async_validation = False # Build and validate edited objects in `validation_executor`
+    validation_executor = None # A concurrent.futures executor, or None for a shared thread
 
     def __init__(self, obj, adapter=None):
         r"""
@@ -162,11 +314,18 @@ class GridViewEditor(BindableEditorClass):
             TypeError: Cannot find an Adapter for this object (<type 'sage.symbolic.expression.Expression'>)
         """
         self.donottrack = True
-        self.dirty = {}
+        self.dirty = DirtyOverlay()
+        self._pending = None # Cell edits of the current transaction, if any
+        self.pending = set() # Positions waiting for an asynchronous validation
+        self._validation = None # (future, value, pos, val) of the latest asynchronous validation
+        self._addable_cache = None
+        self._removable_cache = None
         super(GridViewEditor, self).__init__()
         self.value = obj
         self._initval = obj
-        self._history = []
+        self._history = EditHistory(DEFAULT_HISTORY_BUDGET)
+        self._delta_classes = {}
+        self._cells_value = None
         self.dirty_errors = {}
         if adapter:
             self.adapter = adapter
@@ -215,68 +374,308 @@ class GridViewEditor(BindableEditorClass):
 
     def modified_add_traits(self, **traits):
         r"""
-        Dynamically add trait attributes to the HasTraits instance.
+        Dynamically set the trait attributes of the HasTraits instance.
         Modified code according to Ryan Morshead's pull request
         Cf https://github.com/ipython/traitlets/pull/501
+
+        The instance class is rebased onto its original class,
+        with exactly the traits `traits`. Generated classes are cached
+        by trait names and adapter cell types and zero values
+        -- the trait defaults --, so that a class is reused whenever the grid shape
+        is the same. Values of `traits` are trait objects, or callables
+        that return one -- only called on a cache miss.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.__class__.__mro__[1]
+            <class 'sage_combinat_widgets.grid_view_editor.GridViewEditor'>
+            sage: cls = e.__class__
+            sage: e.donottrack = False
+            sage: e.set_value(Tableau([[1, 2, 7, 6], [3], [4]]))
+            sage: e.__class__ is cls
+            True
+            sage: e.cell_0_2
+            7
+            sage: e.set_value(Tableau([[1, 2, 7], [3], [4]]))
+            sage: e.__class__ is cls, e.__class__.__mro__[1] is cls.__mro__[1]
+            (False, True)
+            sage: hasattr(e, 'cell_0_3')
+            False
+            sage: cls = e.__class__
+            sage: e.adapter.addablecellzero = Integer(1)
+            sage: e.compute_traits()
+            sage: e.__class__ is cls, e.add_0_3
+            (False, 1)
         """
         cls = self.__class__
-        attrs = {"__module__": cls.__module__}
-        if hasattr(cls, "__qualname__"):
-          # __qualname__ introduced in Python 3.3 (see PEP 3155)
-          attrs["__qualname__"] = cls.__qualname__
-        attrs.update(traits)
-        self.__class__ = type(cls.__name__, (cls,), attrs)
-        for trait in traits.values():
-            trait.instance_init(self)
+        base = cls.__dict__.get('_trait_base_class', cls)
+        adapter = self.adapter
+        key = (base, frozenset(traits.keys()),
+               adapter.traitclass, adapter.celltype, adapter.addablecelltype,
+               _zero_key(adapter.cellzero), _zero_key(adapter.addablecellzero))
+        try:
+            new_cls = _trait_classes.pop(key)
+        except KeyError:
+            attrs = {"__module__": base.__module__, "_trait_base_class": base}
+            if hasattr(base, "__qualname__"):
+              # __qualname__ introduced in Python 3.3 (see PEP 3155)
+              attrs["__qualname__"] = base.__qualname__
+            for name, trait in traits.items():
+                if not isinstance(trait, traitlets.TraitType):
+                    trait = trait()
+                trait.name = name
+                attrs[name] = trait
+            attrs["_dynamic_traits"] = tuple(attrs[name] for name in traits)
+            new_cls = type(base.__name__, (base,), attrs)
+            if len(_trait_classes) >= MAX_TRAIT_CLASSES:
+                _trait_classes.popitem(last=False) # Evict the least recently used
+        _trait_classes[key] = new_cls
+        if new_cls is not cls:
+            self.__class__ = new_cls
+            for trait in new_cls._dynamic_traits:
+                trait.instance_init(self)
 
     def compute(self, obj=None):
         r"""We have an object value
         but we want to compute cells
         as a dictionary (row_number, cell_number_in_row) -> trait
+
+        The cell index is updated for the changed cells only,
+        when the grid shape is the same. Then `changed_rows`
+        is the set of rows to redraw; it is ``None`` after a full computation.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.changed_rows is None
+            True
+            sage: e.donottrack = False
+            sage: e.set_value(Tableau([[1, 2, 5, 6], [3, 7], [4]]))
+            sage: sorted(e.changed_rows) # The new cell, and addable cells of row 2
+            [1, 2]
+            sage: e.index.width(1)
+            3
         """
         if not obj:
             obj = self.value
         if obj is None:
             return
-        self.cells = self.adapter.compute_cells(obj)
-        celltype = self.adapter.celltype
+        old_cells = self.cells if self._cells_value is not None else None
+        cells = None
+        if self._cells_value is not None and self._cells_value is not obj \
+           and hasattr(self.adapter, 'update_cells'):
+            cells = self.adapter.update_cells(self.cells, self._cells_value, obj)
+        if cells is None:
+            cells = self.adapter.compute_cells(obj)
+        self.cells = cells
+        self._cells_value = obj
+        self.traitclass = self.adapter.traitclass
+        shape = self.adapter.shape(obj) if hasattr(self.adapter, 'shape') else None
+        self.changed_rows = None
+        if old_cells is not None and old_cells is not cells and self.index.shape == shape:
+            positions = changed_positions(old_cells, cells)
+            if positions is not None:
+                self.changed_rows = self.index.update(cells, positions, self.addable_cells(), self.removable_cells())
+        if self.changed_rows is None:
+            self.index = CellIndex(self.cells, self.addable_cells(), self.removable_cells(), shape)
+        if self.cell_traits:
+            self.compute_traits(rows=self.changed_rows)
+
+    def in_viewport(self, pos):
+        r"""
+        Is position `pos` inside the editor viewport, if any?
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(matrix(ZZ, 4, 4, range(16)))
+            sage: e.in_viewport((3,3))
+            True
+            sage: e.viewport = (1, 0, 2, 2)
+            sage: e.in_viewport((3,3)), e.in_viewport((2,1))
+            (False, True)
+        """
+        if not self.viewport:
+            return True
+        row0, col0, nrows, ncols = self.viewport
+        return row0 <= pos[0] < row0 + nrows and col0 <= pos[1] < col0 + ncols
+
+    def zero_positions(self, rows=None):
+        r"""
+        For sparse grids, list the zero cells that get a cell trait,
+        that is those inside the viewport -- and in `rows`, if given.
+        Without a viewport, zero cells are not editable.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
+            sage: m = matrix(ZZ, 3, 3, {(1,1): 5}, sparse=True)
+            sage: e = GridViewEditor(m, adapter=MatrixGridViewAdapter(m, sparse=True))
+            sage: e.zero_positions()
+            []
+            sage: e.viewport = (0, 0, 2, 2)
+            sage: e.zero_positions()
+            [(0, 0), (0, 1), (1, 0)]
+            sage: e.zero_positions(rows=[1])
+            [(1, 0)]
+        """
+        shape = self.index.shape
+        if not shape or not self.viewport:
+            return []
+        row0, col0, nrows, ncols = self.viewport
+        return [(i,j) for i in range(row0, min(row0 + nrows, shape[0])) if rows is None or i in rows
+                for j in range(col0, min(col0 + ncols, shape[1])) if not (i,j) in self.cells]
+
+    def trait_name(self, kind, pos):
+        r"""
+        Return the name of the cell trait of kind `kind`
+        ('cell' or 'add') for position `pos`.
+        With a viewport, positions are taken relative to its origin,
+        so that moving the viewport keeps the same trait names
+        -- and the same trait class.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(matrix(ZZ, 4, 4, range(16)))
+            sage: e.trait_name('cell', (2,1))
+            'cell_2_1'
+            sage: e.viewport = (1, 0, 2, 2)
+            sage: e.trait_name('cell', (2,1))
+            'cell_1_1'
+        """
+        if self.viewport:
+            pos = (pos[0] - self.viewport[0], pos[1] - self.viewport[1])
+        return '%s_%d_%d' % (kind, pos[0], pos[1])
+
+    def trait_position(self, name):
+        r"""
+        Return the grid position of cell trait `name`.
+        """
+        route = self._trait_routes.get(name)
+        if route is not None:
+            return route[1]
+        return extract_coordinates(name)
+
+    def row_trait_routes(self, i):
+        r"""
+        Return the cell trait routes of row `i`, as a dictionary
+        { trait name : ('cell' or 'add', position) }.
+        Only positions inside the viewport get a trait.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2], [3]]))
+            sage: sorted(e.row_trait_routes(1).items())
+            [('add_1_1', ('add', (1, 1))), ('cell_1_0', ('cell', (1, 0)))]
+        """
+        index = self.index
+        routes = {}
+        for j in index.addable_rows.get(i, ()):
+            if self.in_viewport((i,j)):
+                routes[self.trait_name('add', (i,j))] = ('add', (i,j))
+        for j in index.rows.get(i, {}):
+            if self.in_viewport((i,j)):
+                routes[self.trait_name('cell', (i,j))] = ('cell', (i,j))
+        for pos in self.zero_positions(rows=[i]):
+            routes[self.trait_name('cell', pos)] = ('cell', pos)
+        return routes
+
+    def compute_traits(self, rows=None):
+        r"""
+        Set the cell traits -- 'cell_i_j' for cells
+        and 'add_i_j' for addable cells -- and their values.
+        Only positions inside the viewport get a trait,
+        named after their position in the viewport (see :meth:`trait_name`).
+
+        With a set of rows `rows` whose trait names did not change,
+        only the values of these rows are set. Otherwise the
+        trait class is computed again for the whole grid.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(matrix(ZZ, 4, 4, range(16)))
+            sage: e.viewport = (1, 0, 2, 2)
+            sage: e.compute_traits()
+            sage: sorted(t for t in e.traits() if t.startswith('cell_'))
+            ['cell_0_0', 'cell_0_1', 'cell_1_0', 'cell_1_1']
+            sage: e.cell_1_1
+            9
+            sage: e._trait_routes['cell_1_1']
+            ('cell', (2, 1))
+            sage: cls = e.__class__
+            sage: e.cells[(2,1)] = 42
+            sage: e.compute_traits(rows={2})
+            sage: e.__class__ is cls, e.cell_1_1
+            (True, 42)
+            sage: e.viewport = (2, 1, 2, 2) # Same viewport shape, same class
+            sage: e.compute_traits()
+            sage: e.__class__ is cls, e.cell_0_0, e._trait_routes['cell_0_0']
+            (True, 42, ('cell', (2, 1)))
+        """
         cellzero = self.adapter.cellzero
+        if rows is not None and self._trait_rows is not None:
+            row_routes = [self.row_trait_routes(i) for i in rows]
+            if all(set(routes) == self._trait_rows.get(i, set()) for i, routes in zip(rows, row_routes)):
+                for routes in row_routes:
+                    for name, (kind, pos) in routes.items():
+                        if kind == 'add':
+                            self._trait_values.pop(name, None)
+                        else:
+                            self._trait_values[name] = self.cells.get(pos, cellzero)
+                return
+        celltype = self.adapter.celltype
         addablecelltype = self.adapter.addablecelltype or celltype
         addablecellzero = self.adapter.addablecellzero or cellzero
-        traitclass = self.adapter.traitclass
-        traits_to_add = {}
-        for pos in self.addable_cells():
+        traitclass = self.traitclass
+        def make_addable_trait():
             # Empty traits for addable cells
-            emptytraitname = 'add_%d_%d' % pos
             try:
-                emptytrait = traitclass(addablecellzero)
+                return traitclass(addablecellzero)
             except:
                 try:
-                    emptytrait = traitclass(addablecelltype)
+                    return traitclass(addablecelltype)
                 except:
                     raise TypeError("Cannot init the trait (traitclass=%s, celltype=%s, default_value=%s)" % (
                         traitclass, addablecelltype, addablecellzero))
-            emptytrait.name = emptytraitname
-            traits_to_add[emptytraitname] = emptytrait
-        for pos, val in self.cells.items():
-            traitname = 'cell_%d_%d' % pos
-            traitvalue = val
-            if traitname in self._trait_values:
-                self._trait_values[traitname] = traitvalue
-            else:
+        def make_cell_trait():
+            try:
+                return traitclass(cellzero)
+            except:
                 try:
-                    trait = traitclass(traitvalue)
+                    return traitclass(celltype)
                 except:
-                    try:
-                        trait = traitclass(celltype)
-                        trait.value = traitvalue
-                    except:
-                        raise TypeError("Cannot init the trait (traitclass=%s, celltype=%s, default_value=%s)" % (
-                            traitclass, celltype, cellzero))
-                trait.name = traitname
-                traits_to_add[traitname] = trait
-        self.traitclass = traitclass
-        self.modified_add_traits(**traits_to_add)
+                    raise TypeError("Cannot init the trait (traitclass=%s, celltype=%s, default_value=%s)" % (
+                        traitclass, celltype, cellzero))
+        addable_positions = [pos for pos in self.index.addable_list if self.in_viewport(pos)]
+        cell_positions = [pos for pos in self.cells if self.in_viewport(pos)] + self.zero_positions()
+        traits = {}
+        routes = {}
+        for pos in addable_positions:
+            name = self.trait_name('add', pos)
+            traits[name] = make_addable_trait
+            routes[name] = ('add', pos)
+        for pos in cell_positions:
+            name = self.trait_name('cell', pos)
+            traits[name] = make_cell_trait
+            routes[name] = ('cell', pos)
+        self._trait_routes = routes
+        self._trait_rows = {}
+        for name, (kind, pos) in routes.items():
+            self._trait_rows.setdefault(pos[0], set()).add(name)
+        self.modified_add_traits(**traits)
+        # Trait objects may come from a cached class: set values explicitly
+        for name, (kind, pos) in routes.items():
+            if kind == 'add':
+                self._trait_values.pop(name, None)
+            else:
+                self._trait_values[name] = self.cells.get(pos, cellzero)
 
     def compute_height(self):
         r"""
@@ -296,17 +695,10 @@ class GridViewEditor(BindableEditorClass):
             sage: e.height
             4
         """
-        if not hasattr(self, 'cells'):
+        if not hasattr(self, 'index'):
             self.compute()
-        if self.cells:
-            maxpos = max(pos[0] for pos in self.cells)
-        else:
-            maxpos = -1
-        self.height = maxpos + 1 # Number of rows in self.value
-        for pos in self.addable_cells():
-            if pos[0] > maxpos:
-                maxpos = pos[0]
-        self.total_height =  maxpos + 1 # Graphical height
+        self.height = self.index.height # Number of rows in self.value
+        self.total_height = self.index.total_height # Graphical height
 
     def reset_links(self):
         r"""
@@ -325,10 +717,11 @@ class GridViewEditor(BindableEditorClass):
         return
 
     @abstractmethod
-    def draw(self, cast=None):
+    def draw(self, cast=None, changed=None):
         r"""
         Build the visual representation
         and cdlink objects -- with cast function `cast`.
+        With a set of rows `changed`, only these rows need to be redrawn.
         """
         return
 
@@ -372,30 +765,110 @@ class GridViewEditor(BindableEditorClass):
             raise ValueError("Object %s is not compatible. %s" % (obj, res))
         self.value = obj # Will call the observer, but only if value has changed
 
-    def push_history(self, obj):
+    @property
+    def history_budget(self):
+        r"""
+        The estimated size, in bytes, of undo/redo history.
+        Setting it trims the history at once.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.history_budget = 10**6
+            sage: e.history_budget, e._history.budget
+            (1000000, 1000000)
+        """
+        return self._history.budget
+
+    @history_budget.setter
+    def history_budget(self, budget):
+        self._history.budget = budget
+        self._history.trim()
+
+    def snapshot(self, obj, cells=None):
+        r"""
+        Make a snapshot history entry for object `obj`,
+        sized by its cells.
+        """
+        if cells is None:
+            try:
+                cells = self.adapter.compute_cells(obj)
+            except Exception:
+                pass
+        return Snapshot(obj, cells)
+
+    def supports_deltas(self, obj):
+        r"""
+        Can objects of the class of `obj` be rebuilt from their cells?
+        Checked once per class, by a round trip through `from_cells`.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.supports_deltas(e.value)
+            True
+            sage: e = GridViewEditor(graphs.AztecDiamondGraph(2))
+            sage: e.supports_deltas(e.value)
+            False
+        """
+        cls = obj.__class__
+        if cls not in self._delta_classes:
+            try:
+                rebuilt = self.adapter.from_cells(self.adapter.compute_cells(obj))
+                self._delta_classes[cls] = rebuilt.__class__ is cls and rebuilt == obj
+            except Exception:
+                self._delta_classes[cls] = False
+        return self._delta_classes[cls]
+
+    def history_entry(self, obj, old_cells, new_cells):
+        r"""
+        Make a history entry for going back to object `obj`.
+        A cell delta when `obj` can be rebuilt from its cells
+        and few cells changed, a snapshot otherwise.
+
+        INPUT:
+
+            - ``obj`` -- the old object
+            - ``old_cells`` -- cells of `obj`, or ``None`` if unknown
+            - ``new_cells`` -- cells of the new object
+        """
+        if old_cells is not None and self.supports_deltas(obj):
+            delta = diff_cells(old_cells, new_cells)
+            if 2 * len(delta.changes) <= len(old_cells):
+                return delta
+        return self.snapshot(obj, old_cells)
+
+    def push_history(self, obj, old_cells=None):
         r"""
         Push an object to editor history.
-        Ensure that history does not become too long.
+        History is kept within `history_budget` bytes.
 
         INPUT:
 
             - ``obj`` -- an object (the old one)
+            - ``old_cells`` -- the old object cells, if known
 
         TESTS::
 
             sage: from sage_combinat_widgets import GridViewEditor
             sage: t = Tableau([[1, 2, 5, 6], [3], [4]])
             sage: e = GridViewEditor(t)
-            sage: e._history
+            sage: list(e._history)
             []
             sage: e.push_history(t)
-            sage: e._history
-            [[[1, 2, 5, 6], [3], [4]]]
-
+            sage: list(e._history)
+            [Snapshot([[1, 2, 5, 6], [3], [4]])]
+            sage: e.history_budget = 0
+            sage: e.push_history(Tableau([[1, 2, 5], [3], [4]]))
+            sage: list(e._history)
+            [Snapshot([[1, 2, 5], [3], [4]])]
         """
-        self._history.append(obj)
-        if len(self._history) > MAX_LEN_HISTORY:
-            self._history = self._history[1:]
+        if old_cells is None:
+            self._history.record(self.snapshot(obj))
+        else:
+            self._history.record(self.history_entry(obj, old_cells, self.cells))
 
     @traitlets.observe('value')
     def value_changed(self, change):
@@ -413,36 +886,84 @@ class GridViewEditor(BindableEditorClass):
             sage: new_t = Tableau([[1, 2, 7, 6], [3], [4]])
             sage: e = GridViewEditor(t)
             sage: e.donottrack = False # This class is not meant to work by itself without a widget.
-            sage: e._history
+            sage: list(e._history)
             []
-            sage: from traitlets import Bunch
-            sage: e.value_changed(Bunch({'name': 'value', 'old': t, 'new': new_t, 'owner': e, 'type': 'change'}))
-            sage: e._history
-            [[[1, 2, 5, 6], [3], [4]]]
+            sage: e.set_value(new_t) # Calls the observer
+            sage: list(e._history)
+            [CellDelta([((0, 2), 5, 7)])]
         """
         self.reset_dirty()
+        self._addable_cache = None
+        self._removable_cache = None
+        self.cancel_validation()
         if self.donottrack:
             return
         old_val = change.old
         new_val = change.new
         actually_changed = (id(new_val) != id(old_val))
         if actually_changed:
-            self.push_history(old_val)
+            old_cells = self.cells if self._cells_value is old_val else None
             self.compute()
-            self.draw()
+            self.push_history(old_val, old_cells)
+            self.draw(changed=self.changed_rows)
 
-    def pop_value(self):
+    def restore(self, entry):
         r"""
+        Restore the value recorded in history entry `entry`,
+        through the incremental redraw.
+        Return the entry that would restore the current value.
         """
-        if not self._history:
-            print("No more history!")
-            return
-        prev = self._history.pop()
+        if isinstance(entry, CellDelta):
+            obj = self.adapter.from_cells(entry.revert(self.cells))
+            back = entry.inverse()
+        else:
+            obj = entry.obj
+            back = self.snapshot(self.value, self.cells)
         self.donottrack = True
-        self.value = prev
+        self.value = obj
         self.compute()
-        self.draw()
+        self.draw(changed=self.changed_rows)
         self.donottrack = False
+        return back
+
+    def pop_value(self):
+        r"""
+        Undo the last change.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.donottrack = False
+            sage: e.set_value(Tableau([[1, 2, 7, 6], [3], [4]]))
+            sage: e.set_value(Tableau([[1, 2, 7], [3], [4]]))
+            sage: e.pop_value()
+            sage: e.value, e.cell_0_2
+            ([[1, 2, 7, 6], [3], [4]], 7)
+            sage: e.pop_value()
+            sage: e.value
+            [[1, 2, 5, 6], [3], [4]]
+            sage: e.pop_value()
+            No more history!
+            sage: e.redo_value()
+            sage: e.value
+            [[1, 2, 7, 6], [3], [4]]
+        """
+        entry = self._history.pop_undo()
+        if entry is None:
+            print("No more history!")
+            return
+        self._history.push_redo(self.restore(entry))
+
+    def redo_value(self):
+        r"""
+        Redo the last undone change.
+        """
+        entry = self._history.pop_redo()
+        if entry is None:
+            print("Nothing to redo!")
+            return
+        self._history.push_undo(self.restore(entry))
 
     def get_cells(self):
         r"""
@@ -458,6 +979,17 @@ class GridViewEditor(BindableEditorClass):
 
             -  ``obj_class`` -- an object class (by default: self.value.__class__)
             -  ``cells`` -- a dictionary (i,j)->val
+
+        Graphs are rebuilt with edges between neighbour cells.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: from sage.graphs.generators.basic import GridGraph
+            sage: e = GridViewEditor(GridGraph((2, 2)))
+            sage: e.set_value_from_cells(cells={(0, 0): None, (0, 1): None, (1, 0): None})
+            sage: e.value.num_edges()
+            2
         """
         if not obj_class and self.value:
             obj_class = self.value.__class__
@@ -465,7 +997,10 @@ class GridViewEditor(BindableEditorClass):
             return
         if hasattr(self.adapter, 'from_cells'):
             try:
-                obj = self.adapter.from_cells(cells)
+                if issubclass(obj_class, GenericGraph):
+                    obj = self.adapter.from_cells(cells, edges=True)
+                else:
+                    obj = self.adapter.from_cells(cells)
             except:
                 raise ValueError("Could not make an object of class '%s' from given cells" % str(obj_class))
         elif hasattr(obj_class, 'cells') or hasattr(obj_class, 'rows'): # e.g. a tableau / matrix / vector
@@ -537,7 +1072,7 @@ class GridViewEditor(BindableEditorClass):
             {(2, 0): 9}
         """
         del self.dirty[pos]
-        del self.dirty_errors[pos]
+        self.dirty_errors.pop(pos, None)
 
     def reset_dirty(self):
         r"""
@@ -562,7 +1097,7 @@ class GridViewEditor(BindableEditorClass):
         """
         if not self.dirty: # Prevent any interactive loops
             return
-        self.dirty = {}
+        self.dirty = DirtyOverlay()
         self.dirty_errors = {}
 
     def dirty_info(self, pos):
@@ -592,6 +1127,34 @@ class GridViewEditor(BindableEditorClass):
         return ''
 
     @traitlets.observe(traitlets.All)
+    def route_change(self, change):
+        r"""
+        Route a trait change to the cell handlers,
+        through the `_trait_routes` table.
+        Other traits are ignored.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.donottrack = False
+            sage: e.cell_0_2 = 7
+            sage: e.value
+            [[1, 2, 7, 6], [3], [4]]
+            sage: e.add_1_1 = 8
+            sage: e.value
+            [[1, 2, 7, 6], [3, 8], [4]]
+        """
+        route = self._trait_routes.get(change.name)
+        if route is None or self.donottrack:
+            return
+        if route[0] == 'cell':
+            self.remove_cell(change)
+            self.set_cell(change)
+        else:
+            self.add_cell(change)
+            self.remove_cell(change)
+
     def set_cell(self, change):
         r"""
         What to do when a cell value has been changed.
@@ -616,11 +1179,32 @@ class GridViewEditor(BindableEditorClass):
             return
         if change.new == change.old or not change.new:
             return
-        pos = extract_coordinates(change.name)
-        val = change.new
+        self.apply_set(self.trait_position(change.name), change.new)
+
+    def apply_set(self, pos, val):
+        r"""
+        Set the value of cell `pos` to `val`,
+        through the adapter. Mark the cell as dirty
+        if the new value is not valid.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(StandardTableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.apply_set((0,2), 7)
+            sage: e.dirty
+            {(0, 2): 7}
+        """
+        if self._pending is not None:
+            self._pending[pos] = val
+            return
+        if self.async_validation:
+            self.dirty[pos] = val # Later edits will build upon this one
+            self.submit_validation(pos, val, self.adapter.set_cell, self.value, pos, val, DirtyOverlay(self.dirty))
+            return
         result = self.adapter.set_cell(self.value, pos, val, dirty=self.dirty)
         if issubclass(result.__class__, BaseException): # Setting cell was impossible
-            if val == self.cells[pos] and self.dirty.keys() == [pos]: # Rollback
+            if val == self.cells.get(pos) and self.dirty.keys() == [pos]: # Rollback
                 self.reset_dirty()
             else: # Add an entry in self.dirty dictionary
                 self.set_dirty(pos, val, result)
@@ -628,23 +1212,377 @@ class GridViewEditor(BindableEditorClass):
         # Success
         self.set_value(result)
 
+    def submit_validation(self, pos, val, fn, *args):
+        r"""
+        Asynchronous validation mode: build and validate a new object
+        by calling `fn(*args)` in the validation executor,
+        for the edit of cell `pos` to value `val`.
+        Cell `pos` is pending until the result comes back.
+        The result is applied from the kernel event loop,
+        or by `wait_validation` when there is no running loop.
+        Any earlier validation is superseded: it is cancelled
+        if not started yet, and its result will be ignored.
+        If the new object is not valid, cell `pos` is marked dirty.
+
+        Cell sets, additions and removals all go through here.
+        For Sage objects, building the object is what validates it,
+        so both run in the worker thread. This is safe as long as
+        `fn` does not change its arguments: the editor value is
+        never passed to in-place adapter methods, only a copy of it,
+        made in the kernel thread. Adapters may remember their last
+        edit (see `update_cells`); that record is checked against
+        the resulting object before use, so a superseded validation
+        finishing late cannot mislead it.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.donottrack = False
+            sage: e.async_validation = True
+            sage: e.apply_set((0,2), 7)
+            sage: e.pending
+            {(0, 2)}
+            sage: e.wait_validation()
+            sage: e.value, e.pending
+            ([[1, 2, 7, 6], [3], [4]], set())
+            sage: e = GridViewEditor(StandardTableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.async_validation = True
+            sage: e.apply_set((0,2), 7)
+            sage: e.wait_validation()
+            sage: e.value, e.dirty
+            ([[1, 2, 5, 6], [3], [4]], {(0, 2): 7})
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.donottrack = False
+            sage: e.async_validation = True
+            sage: e.apply_add((1,1), True)
+            sage: e.wait_validation()
+            sage: e.apply_remove((0,2))
+            sage: e.wait_validation()
+            sage: e.value
+            [2, 2]
+        """
+        if self._validation:
+            self._validation[0].cancel()
+        executor = self.validation_executor or default_validation_executor()
+        future = executor.submit(fn, *args)
+        self._validation = (future, self.value, pos, val)
+        self.set_pending(pos)
+        loop = IOLoop.current(instance=False) if IOLoop else None
+        if loop is not None: # Apply the result back in the kernel thread
+            future.add_done_callback(lambda f: loop.add_callback(self.validation_done, f))
+
+    def validation_done(self, future):
+        r"""
+        Apply the result of asynchronous validation `future`,
+        unless it has been superseded.
+        """
+        if not self._validation or self._validation[0] is not future:
+            return # Stale
+        value, edited, val = self._validation[1:]
+        self._validation = None
+        pending, self.pending = self.pending, set()
+        for pos in pending:
+            self.unset_pending(pos)
+        if value is not self.value or future.cancelled():
+            return
+        result = future.exception() or future.result()
+        if issubclass(result.__class__, BaseException):
+            if not edited in self.dirty:
+                self.set_dirty(edited, val, result)
+            for pos in sorted(pending):
+                if pos in self.dirty:
+                    self.set_dirty(pos, self.dirty[pos], result)
+            return
+        self.set_value(result)
+
+    def wait_validation(self):
+        r"""
+        Wait for the current asynchronous validation, if any, and apply it.
+        """
+        if self._validation:
+            future = self._validation[0]
+            try:
+                future.result()
+            except Exception:
+                pass
+            self.validation_done(future)
+
+    def cancel_validation(self):
+        r"""
+        Drop the current asynchronous validation, if any.
+        """
+        if self._validation:
+            self._validation[0].cancel()
+            self._validation = None
+        for pos in self.pending:
+            self.unset_pending(pos)
+        self.pending = set()
+
+    def set_pending(self, pos):
+        r"""
+        Mark cell `pos` as waiting for validation.
+        """
+        self.pending.add(pos)
+
+    def unset_pending(self, pos):
+        r"""
+        Cell `pos` is no more waiting for validation.
+        Widgets update the cell display here.
+        """
+        pass
+
+    @contextmanager
+    def transaction(self):
+        r"""
+        Context manager for batch edits.
+        Cell edits (`apply_set`, `apply_add`, `apply_remove`) are kept pending
+        until exit. Then the object is rebuilt and validated once,
+        recorded as one history entry and redrawn once.
+        If the result is not valid, pending edits are marked as dirty.
+        Nested transactions belong to the outermost one.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(matrix(QQ, 3, 3, range(9)))
+            sage: e.donottrack = False
+            sage: with e.transaction():
+            ....:     e.apply_set((0,0), 5)
+            ....:     e.apply_set((1,1), 7)
+            sage: e.value
+            [5 1 2]
+            [3 7 5]
+            [6 7 8]
+            sage: len(e._history)
+            1
+            sage: e = GridViewEditor(StandardTableau([[1, 2, 5, 6], [3], [4]]))
+            sage: with e.transaction():
+            ....:     e.apply_set((0,2), 7)
+            ....:     e.apply_set((0,3), 8)
+            sage: e.dirty
+            {(0, 2): 7, (0, 3): 8}
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.donottrack = False
+            sage: with e.transaction():
+            ....:     e.apply_remove((2,0))
+            ....:     e.apply_set((0,3), 7)
+            sage: e.value
+            [[1, 2, 5, 7], [3]]
+        """
+        if self._pending is not None:
+            yield self
+            return
+        self._pending = {}
+        try:
+            yield self
+        except:
+            self._pending = None
+            raise
+        pending, self._pending = self._pending, None
+        self.apply_pending(pending)
+
+    def apply_pending(self, pending):
+        r"""
+        Apply dictionary `pending` { position : value } of cell edits:
+        values and additions, then removals (``ABSENT`` values),
+        from the last position to the first.
+        When the adapter absorbs dirty values, values and additions
+        go through one adapter call. Otherwise they are applied
+        one at a time on the running result, in position order.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.donottrack = False
+            sage: with e.transaction():
+            ....:     e.apply_add((0,3), True)
+            ....:     e.apply_add((1,1), True)
+            sage: e.value
+            [4, 2]
+        """
+        if not pending:
+            return
+        adapter = self.adapter
+        removals = sorted((pos for pos in pending if pending[pos] is ABSENT), reverse=True)
+        edits = sorted((pos, val) for pos, val in pending.items() if val is not ABSENT)
+        result = self.value
+        def apply_one(result, pos, val, dirty):
+            if pos in self.cells:
+                return adapter.set_cell(result, pos, val, dirty=dirty)
+            return adapter.add_cell(adapter.copy(result), pos, val, dirty=dirty)
+        if adapter.absorbs_dirty:
+            dirty = DirtyOverlay(self.dirty)
+            dirty.update(edits)
+            for pos in removals:
+                dirty.pop(pos, None)
+            if dirty:
+                pos = max(dirty)
+                try:
+                    result = apply_one(result, pos, dirty.pop(pos), dirty)
+                except Exception as e:
+                    result = e
+        else:
+            for pos, val in edits:
+                try:
+                    result = apply_one(result, pos, val, DirtyOverlay())
+                except Exception as e:
+                    result = e
+                if issubclass(result.__class__, BaseException):
+                    break
+        for pos in removals:
+            if issubclass(result.__class__, BaseException):
+                break
+            try:
+                result = adapter.remove_cell(adapter.copy(result), pos, dirty=DirtyOverlay())
+            except Exception as e:
+                result = e
+        if issubclass(result.__class__, BaseException): # Keep all edits for later
+            for p in sorted(pending):
+                val = pending[p]
+                self.set_dirty(p, adapter.cellzero if val is ABSENT else val, result)
+            return
+        self.set_value(result)
+
+    def set_cells(self, cells):
+        r"""
+        Set several cell values at once, from dictionary
+        `cells` { position : value }.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.donottrack = False
+            sage: e.set_cells({(0,2): 7, (0,3): 8, (1,0): 9})
+            sage: e.value
+            [[1, 2, 7, 8], [9], [4]]
+        """
+        with self.transaction():
+            for pos, val in cells.items():
+                self.apply_set(pos, val)
+
+    def apply_patch(self, op, pos, val=None):
+        r"""
+        Apply an edit event, in patch mode:
+        operation `op` at position `pos` with value `val`.
+        Operation is one of 'set', 'add' or 'remove'.
+        Setting a cell to zero, or pressing a cell button, removes the cell.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.donottrack = False
+            sage: e.apply_patch('set', (0,2), 7)
+            sage: e.value
+            [[1, 2, 7, 6], [3], [4]]
+            sage: e.apply_patch('add', (1,1), 8)
+            sage: e.value
+            [[1, 2, 7, 6], [3, 8], [4]]
+            sage: e.apply_patch('set', (2,0), 0)
+            sage: e.value
+            [[1, 2, 7, 6], [3, 8]]
+            sage: e.apply_patch('flip', (0,0), 1)
+            Traceback (most recent call last):
+            ...
+            ValueError: Unknown patch operation 'flip'
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.donottrack = False
+            sage: e.apply_patch('set', (0,2), True)
+            sage: e.value
+            [2, 1]
+            sage: e.apply_patch('add', (2,0), True)
+            sage: e.value
+            [2, 1, 1]
+        """
+        if self.donottrack:
+            return
+        if val is not True:
+            val = self.to_cell(val)
+        if op == 'set':
+            if val is True or val == self.adapter.cellzero:
+                op = 'remove'
+            elif pos in self.cells and val == self.cells[pos] and not pos in self.dirty:
+                return # Nothing changed
+        if op == 'set':
+            self.apply_set(pos, val)
+        elif op == 'add':
+            if val == self.adapter.cellzero: # Dirty _addable_ cells can be removed
+                if pos in self.dirty:
+                    self.unset_dirty(pos)
+                return
+            self.apply_add(pos, val)
+        elif op == 'remove':
+            self.apply_remove(pos, val)
+        else:
+            raise ValueError("Unknown patch operation '%s'" % op)
+
     def addable_cells(self):
         r"""
-        List addable cells for editor value
+        List addable cells for editor value.
+        The list is computed once per value.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.addable_cells()
+            [(0, 3), (1, 1), (2, 0)]
+            sage: e.addable_cells() is e.addable_cells()
+            True
+            sage: e.is_addable((1,1)), e.is_addable((1,2))
+            (True, False)
+        """
+        if self._addable_cache is None or self._addable_cache[0] is not self.value:
+            if not hasattr(self.adapter, 'addable_cells') or not callable(self.adapter.addable_cells):
+                cells = [] # Optional method
+            else:
+                cells = self.adapter.addable_cells(self.value)
+            self._addable_cache = (self.value, cells, set(cells))
+        return self._addable_cache[1]
+
+    def is_addable(self, pos):
+        r"""
+        Is `pos` an addable cell position for editor value?
         """
-        if not hasattr(self.adapter, 'addable_cells') or not callable(self.adapter.addable_cells):
-            return [] # Optional method
-        return self.adapter.addable_cells(self.value)
+        self.addable_cells()
+        return pos in self._addable_cache[2]
 
     def removable_cells(self):
         r"""
         List removable cells for editor value.
+        The list is computed once per value.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.removable_cells()
+            [(0, 2), (1, 0)]
+            sage: e.donottrack = False
+            sage: e.set_value(Partition([3, 2]))
+            sage: e.removable_cells()
+            [(0, 2), (1, 1)]
+            sage: e.is_removable((1,1)), e.is_removable((1,0))
+            (True, False)
+        """
+        if self._removable_cache is None or self._removable_cache[0] is not self.value:
+            if not hasattr(self.adapter, 'removable_cells') or not callable(self.adapter.removable_cells):
+                cells = [] # Optional method
+            else:
+                cells = self.adapter.removable_cells(self.value)
+            self._removable_cache = (self.value, cells, set(cells))
+        return self._removable_cache[1]
+
+    def is_removable(self, pos):
+        r"""
+        Is `pos` a removable cell position for editor value?
         """
-        if not hasattr(self.adapter, 'removable_cells') or not callable(self.adapter.removable_cells):
-            return [] # Optional method
-        return self.adapter.removable_cells(self.value)
+        self.removable_cells()
+        return pos in self._removable_cache[2]
 
-    @traitlets.observe(traitlets.All)
     def add_cell(self, change):
         r"""
         Add a cell to the widget.
@@ -683,19 +1621,40 @@ class GridViewEditor(BindableEditorClass):
         if not change.name.startswith('add_') \
            or self.to_cell(change.new) == self.adapter.cellzero:
             return
+        self.apply_add(self.trait_position(change.name), change.new)
+
+    def apply_add(self, pos, val):
+        r"""
+        Add a cell with value `val` at position `pos`,
+        through the adapter. Keep the addition as dirty
+        if it is not valid (yet).
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: e.apply_add((1,1), 8)
+            sage: e.value
+            [[1, 2, 5, 6], [3, 8], [4]]
+        """
         if not hasattr(self.adapter, 'add_cell'):
             raise TypeError("Cannot add cell to this object.")
         if self.adapter.add_cell.__func__.__class__ is AbstractMethod:
             return # Method not implemented
         if hasattr(self.adapter.remove_cell, '_optional') and self.adapter.remove_cell._optional: # Not implemented
             raise Exception("Adding cells is not implemented for this object.")
-        val = change.new
         if val is True: # if it's a button, reverse button toggling
             val = False
-        pos = extract_coordinates(change.name)
+        if self._pending is not None:
+            self._pending[pos] = val
+            return
         if pos in self.dirty:
             self.dirty[pos] = val # edit the value before sending to the adapter
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
+        if self.async_validation:
+            self.dirty[pos] = val # Later edits will build upon this one
+            self.submit_validation(pos, val, self.adapter.add_cell, obj, pos, val, DirtyOverlay(self.dirty))
+            return
         result = self.adapter.add_cell(obj, pos, val, dirty=self.dirty)
         if issubclass(result.__class__, BaseException): # Adding cell was impossible
             if pos in self.cells and val == self.cells[pos] and self.dirty.keys() == [pos]: # Rollback
@@ -705,7 +1664,6 @@ class GridViewEditor(BindableEditorClass):
             return
         self.set_value(result)
 
-    @traitlets.observe(traitlets.All)
     def remove_cell(self, change):
         r"""
         What to do when a cell has been removed.
@@ -741,7 +1699,7 @@ class GridViewEditor(BindableEditorClass):
         val = change.new
         if val is True: # if it's a button, reverse button toggling
             val = False
-        pos = extract_coordinates(change.name)
+        pos = self.trait_position(change.name)
         # Dirty _addable_ cells can be removed
         if pos in self.dirty and change.name.startswith('add_') and self.to_cell(val) == self.adapter.cellzero:
             self.unset_dirty(pos)
@@ -751,16 +1709,39 @@ class GridViewEditor(BindableEditorClass):
         if not change.name.startswith('cell_') or val != self.adapter.cellzero \
            or val == self.adapter.addablecellzero or change.old == traitlets.Undefined:
             return
+        self.apply_remove(pos, val)
+
+    def apply_remove(self, pos, val=None):
+        r"""
+        Remove cell at position `pos`, through the adapter.
+        Keep the removal as dirty if it is not valid (yet).
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.apply_remove((1,0))
+            sage: e.value
+            [3]
+        """
+        if val is True: # if it's a button, reverse button toggling
+            val = False
         if not hasattr(self.adapter, 'remove_cell'):
             raise TypeError("Cannot remove cell from this object.")
         if not self.adapter.remove_cell or self.adapter.remove_cell.__func__.__class__ is AbstractMethod:
             return # Method not implemented or deliberately set to None
         if hasattr(self.adapter.remove_cell, '_optional') and self.adapter.remove_cell._optional: # Not implemented
             raise Exception("Removing cells is not implemented for this object.")
-        obj = copy(self.value) # For your pet objects, don't forget to implement __copy__
+        if self._pending is not None:
+            self._pending[pos] = ABSENT
+            return
+        obj = self.adapter.copy(self.value) # For your pet objects, don't forget to implement __copy__
+        if self.async_validation:
+            self.submit_validation(pos, self.adapter.cellzero, self.adapter.remove_cell, obj, pos, DirtyOverlay(self.dirty))
+            return
         result = self.adapter.remove_cell(obj, pos, dirty=self.dirty)
         if issubclass(result.__class__, BaseException): # Removing cell was impossible
-            if pos in self.addable_cells() or (pos in self.cells and val == self.cells[pos]) \
+            if pos in self.index.addable or (pos in self.cells and val == self.cells[pos]) \
                and self.dirty.keys() == [pos]: # Rollback
                 self.reset_dirty()
             else: # Keep temporary substraction for later
@@ -806,7 +1787,7 @@ class GridViewEditor(BindableEditorClass):
             return
         if not hasattr(self.adapter, 'append_row'):
             raise TypeError("Cannot append row to this object.")
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
         obj = self.adapter.append_row(obj, r)
         self.value = obj # Will call the observer
 
@@ -818,7 +1799,7 @@ class GridViewEditor(BindableEditorClass):
             return
         if not hasattr(self.adapter, 'insert_row'):
             raise TypeError("Cannot insert row to this object.")
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
         obj = self.adapter.insert_row(obj, index, r)
         self.value = obj # Will call the observer
 
@@ -830,7 +1811,7 @@ class GridViewEditor(BindableEditorClass):
             return
         if not hasattr(self.adapter, 'remove_row'):
             raise TypeError("Cannot remove row from this object.")
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
         obj = self.adapter.remove_row(obj, index)
         self.value = obj # Will call the observer
 
@@ -871,7 +1852,7 @@ class GridViewEditor(BindableEditorClass):
             return
         if not hasattr(self.adapter, 'append_column'):
             raise TypeError("Cannot append column to this object.")
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
         obj = self.adapter.append_column(obj, c)
         self.value = obj # Will call the observer
 
@@ -883,7 +1864,7 @@ class GridViewEditor(BindableEditorClass):
             return
         if not hasattr(self.adapter, 'insert_column'):
             raise TypeError("Cannot insert column to this object.")
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
         obj = self.adapter.insert_column(obj, index, c)
         self.value = obj # Will call the observer
 
@@ -895,6 +1876,6 @@ class GridViewEditor(BindableEditorClass):
             return
         if not hasattr(self.adapter, 'remove_column'):
             raise TypeError("Cannot remove column from this object.")
-        obj = copy(self.value)
+        obj = self.adapter.copy(self.value)
         obj = self.adapter.remove_column(obj, index)
         self.value = obj # Will call the observer
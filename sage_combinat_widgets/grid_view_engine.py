@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+r"""
+A headless Grid View Engine, for scripts, tests and server-side use.
+
+The engine is a :class:`~sage_combinat_widgets.grid_view_editor.GridViewEditor`
+in patch mode: no cell traits, no widgets, and this module does not import
+ipywidgets. Cell edits, row and column operations, transactions
+and undo/redo history work as in the widgets.
+
+EXAMPLES ::
+
+    sage: from sage_combinat_widgets.grid_view_engine import GridViewEngine
+    sage: e = GridViewEngine(Tableau([[1, 2, 5, 6], [3], [4]]))
+    sage: e.edit('set', (0, 2), 7)
+    sage: e.edit('add', (1, 1), 8)
+    sage: e.value
+    [[1, 2, 7, 6], [3, 8], [4]]
+    sage: e.undo()
+    sage: e.value
+    [[1, 2, 7, 6], [3], [4]]
+    sage: e.redo()
+    sage: e.value
+    [[1, 2, 7, 6], [3, 8], [4]]
+
+AUTHORS ::
+
+    Odile Bénassy, Nicolas Thiéry
+
+"""
+import random
+from time import time
+from .grid_view_editor import GridViewEditor
+
+
+class GridViewEngine(GridViewEditor):
+    r"""
+    Headless editor for grid-representable Sage objects.
+    """
+    cell_traits = False
+
+    def __init__(self, obj, adapter=None):
+        r"""
+        Initialize engine.
+
+        INPUT:
+
+            - ``obj`` -- a Sage object
+            - ``adapter`` -- an adapter object (optional)
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_engine import GridViewEngine
+            sage: e = GridViewEngine(Partition([3, 1]))
+            sage: e.cells
+            {(0, 0): False, (0, 1): False, (0, 2): False, (1, 0): False}
+            sage: hasattr(e, 'cell_0_0')
+            False
+        """
+        super(GridViewEngine, self).__init__(obj, adapter)
+        self.donottrack = False
+
+    def edit(self, op, pos, val=None):
+        r"""
+        Apply operation `op` -- 'set', 'add' or 'remove' --
+        at position `pos`, with value `val`.
+        See :meth:`~sage_combinat_widgets.grid_view_editor.GridViewEditor.apply_patch`.
+        """
+        self.apply_patch(op, pos, val)
+
+    def undo(self):
+        r"""
+        Undo the last change.
+        """
+        self.pop_value()
+
+    def redo(self):
+        r"""
+        Redo the last undone change.
+        """
+        self.redo_value()
+
+
+def random_walk(engine, steps, seed=None):
+    r"""
+    Add or remove `steps` random cells, with buttons semantics
+    (e.g. for partitions). Return the number of edits.
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.grid_view_engine import GridViewEngine, random_walk
+        sage: e = GridViewEngine(Partition([3, 1]))
+        sage: random_walk(e, 20, seed=0)
+        20
+        sage: e.value in Partitions()
+        True
+    """
+    rng = random.Random(seed)
+    for n in range(steps):
+        moves = [('add', pos) for pos in engine.addable_cells()] \
+                + [('remove', pos) for pos in engine.removable_cells()]
+        if not moves:
+            return n
+        op, pos = rng.choice(moves)
+        engine.edit(op, pos, True)
+    return steps
+
+def edits_per_second(obj, steps=1000, seed=0):
+    r"""
+    Benchmark: number of random walk edits per second
+    on a headless engine for `obj`.
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.grid_view_engine import edits_per_second
+        sage: edits_per_second(Partition([5, 3, 1]), 50) > 0
+        True
+    """
+    engine = GridViewEngine(obj)
+    start = time()
+    n = random_walk(engine, steps, seed)
+    return n / max(time() - start, 1e-9)
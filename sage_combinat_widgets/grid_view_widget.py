@@ -9,9 +9,10 @@ AUTHORS ::
 """
 from .grid_view_editor import GridViewEditor, cdlink
 from sage.graphs.generic_graph import GenericGraph
-from ipywidgets import Layout, VBox, HBox, HTML, ValueWidget
+from ipywidgets import Layout, VBox, HBox, HTML, Button, Label, ValueWidget
 from singleton_widgets import *
 from six import text_type
+from contextlib import contextmanager, ExitStack
 
 textcell_layout = Layout(width='3em', margin='0', padding='0')
 textcell_wider_layout = Layout(width='7em', height='3em', margin='0', padding='0')
@@ -27,12 +28,13 @@ class BaseTextCell(TextSingleton):
 
     def __init__(self, content, position, layout, **kws):
         super(BaseTextCell, self).__init__()
-        self.value = content
-        self.layout = layout
-        self.continuous_update = False
-        self.position = position
-        self.description_tooltip = '' # avoid None
-        self.add_class('gridcell')
+        with self.hold_sync():
+            self.value = content
+            self.layout = layout
+            self.continuous_update = False
+            self.position = position
+            self.description_tooltip = '' # avoid None
+            self.add_class('gridcell')
 
 class TextCell(BaseTextCell):
     r"""A regular text grid cell
@@ -62,9 +64,10 @@ class StyledTextCell(TextCell):
     style = None
     def __init__(self, content, position, layout=textcell_layout, **kws):
         super(StyledTextCell, self).__init__(content, position, layout, **kws)
-        self.add_class(self.css_class)
-        if self.disable:
-            self.disabled = True
+        with self.hold_sync():
+            self.add_class(self.css_class)
+            if self.disable:
+                self.disabled = True
         if self.style:
             apply_css(self.style)
 
@@ -118,11 +121,12 @@ class BlankCell(TextSingleton):
 
     def __init__(self, position=None, layout=textcell_layout, **kws):
         super(BlankCell, self).__init__()
-        self.value = ''
-        self.position = position
-        self.layout = layout
-        self.disabled = True
-        self.add_class('blankcell')
+        with self.hold_sync():
+            self.value = ''
+            self.position = position
+            self.layout = layout
+            self.disabled = True
+            self.add_class('blankcell')
 
 class AddableTextCell(BaseTextCell):
     r"""An addable placeholder for adding a cell to the widget
@@ -160,10 +164,11 @@ class ButtonCell(ToggleButtonSingleton):
 
     def __init__(self, content, position, layout=buttoncell_smaller_layout, **kws):
         super(ButtonCell, self).__init__(layout=layout)
-        self.value = content
-        self.position = position
-        self.add_class('gridbutton')
-        self.set_tooltip()
+        with self.hold_sync():
+            self.value = content
+            self.position = position
+            self.add_class('gridbutton')
+            self.set_tooltip()
 
     def set_tooltip(self, s=None):
         r"""From a position (i,j),
@@ -200,12 +205,13 @@ class StyledButtonCell(ButtonCell):
     addable = None
     def __init__(self, content, position, layout=buttoncell_smaller_layout, **kws):
         super(StyledButtonCell, self).__init__(content, position, layout, **kws)
-        if self.css_class:
-            self.add_class(self.css_class)
-        if self.disable:
-            self.disabled = True
-        if self.addable:
-            self.add_class('addablebutton')
+        with self.hold_sync():
+            if self.css_class:
+                self.add_class(self.css_class)
+            if self.disable:
+                self.disabled = True
+            if self.addable:
+                self.add_class('addablebutton')
 
 def styled_button_cell(disabled=False, style_name='', addable=False):
     r"""A function to create CSS-styled buttons.
@@ -247,9 +253,10 @@ class AddableButtonCell(ButtonCell):
     """
     def __init__(self, position, layout=buttoncell_smaller_layout, **kws):
         super(AddableButtonCell, self).__init__(False, position, layout, **kws)
-        self.add_class('addablebutton')
-        self.description = '+'
-        self.tooltip = "Click to add a cell here"
+        with self.hold_sync():
+            self.add_class('addablebutton')
+            self.description = '+'
+            self.tooltip = "Click to add a cell here"
 
 class StyledPushButton(ButtonSingleton):
     r"""A class for CSS-styled push buttons.
@@ -266,11 +273,12 @@ class StyledPushButton(ButtonSingleton):
         super(StyledPushButton, self).__init__(layout=layout, description=description, placeholder=placeholder)
         self.content = content
         self.position = position
-        if self.disable:
-            self.disabled = True
-        self.add_class('gridbutton')
-        if self.css_class:
-            self.add_class(self.css_class)
+        with self.hold_sync():
+            if self.disable:
+                self.disabled = True
+            self.add_class('gridbutton')
+            if self.css_class:
+                self.add_class(self.css_class)
 
 def styled_push_button(disabled=False, style_name=''):
     r"""A function to create CSS-styled push buttons.
@@ -317,7 +325,8 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
     def __init__(self, obj, adapter=None, display_convention='en', cell_layout=None,
                  cell_widget_classes=[TextCell], cell_widget_class_index=lambda x:0,
                  css_classes = [], css_class_index=None,
-                 blank_widget_class=BlankCell, addable_widget_class=AddableTextCell):
+                 blank_widget_class=BlankCell, addable_widget_class=AddableTextCell,
+                 viewport=None):
         r"""
         Grid View Widget initialization.
 
@@ -325,6 +334,7 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             - ``cell_widget_classes``: a list of classes for building cell widgets
             - ``blank_widget_class``: a widget class for building blank cells
             - ``addable_widget_class``: a widget class for building blank cells
+            - ``viewport``: a tuple `(row0, col0, nrows, ncols)` for showing only a window of the grid, with scroll controls
 
         TESTS ::
 
@@ -349,7 +359,17 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             sage: f = interact(f)
             Interactive function <function f at ...> with 1 widget
               x: GridViewWidget(value=Aztec Diamond graph of order 4, ...)
+
+        Windowed display::
+
+            sage: w = GridViewWidget(matrix(ZZ, 50, 50, range(2500)), viewport=(0, 0, 5, 4))
+            sage: len(w.children), len(w.children[0].children)
+            (6, 4)
+            sage: len(w.links)
+            20
         """
+        if viewport:
+            self.viewport = tuple(viewport)
         GridViewEditor.__init__(self, obj, adapter)
         VBox.__init__(self)
         self._model_id = get_model_id(self)
@@ -376,6 +396,38 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
         self.draw()
         self.donottrack = False
 
+    @contextmanager
+    def batch(self, rows=None):
+        r"""
+        A context where state updates of the widget,
+        its rows and its cells are held, then sent
+        as one message per widget on exit.
+        With a set of rows `rows`, only these drawn rows
+        and their cells are held.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_widget import GridViewWidget
+            sage: w = GridViewWidget(Tableau([[1, 2], [3]]))
+            sage: with w.batch():
+            ....:     w.get_child((0,0)).add_class('marked')
+            ....:     w.get_child((0,1)).add_class('marked')
+            sage: w.get_child((0,0))._dom_classes
+            ('gridcell', 'marked')
+        """
+        with ExitStack() as stack:
+            stack.enter_context(self.hold_sync())
+            if rows is None:
+                held = self.children
+            else:
+                row0 = (self.viewport or (0,))[0]
+                held = [t[0] for k, t in enumerate(getattr(self, '_drawn_rows', [])) if row0 + k in rows]
+            for row in held:
+                stack.enter_context(row.hold_sync())
+                for cell in row.children:
+                    stack.enter_context(cell.hold_sync())
+            yield self
+
     def to_cell(self, val):
         r"""
         From a widget cell value `val`,
@@ -391,10 +443,13 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
         """
         return self.cast(val)
 
-    def add_links(self):
+    def add_links(self, rows=None):
         r"""
         Link each individual widget cell
-        to its corresponding trait in the editor
+        to its corresponding trait in the editor.
+        Links of cell widgets kept by :meth:`draw` are kept as well.
+        With a set of rows `rows`, only the cells of these rows are linked,
+        links of other rows are left untouched.
 
         TESTS ::
 
@@ -437,18 +492,72 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             <class 'sage_combinat_widgets.grid_view_widget.TextCell'>
             sage: w2.links[7].source[0].__class__
             <class 'sage_combinat_widgets.grid_view_widget.AddableTextCell'>
+            sage: n = len(w2.links)
+            sage: w2.add_links(rows={1})
+            sage: len(w2.links) == n
+            True
         """
-        for pos in self.cells.keys():
-            traitname = 'cell_%d_%d' % (pos)
-            child = self.get_child(pos)
-            if child and hasattr(child, 'value') and traitname in self.traits():
-                self.links.append(cdlink((child, 'value'), (self, traitname), self.cast))
-        for pos in self.addable_cells():
-            # A directional link to trait 'add_i_j'
-            traitname = 'add_%d_%d' % (pos)
+        index = self.index
+        if rows is None:
+            positions = list(self.cells.keys()) + index.addable_list + self.zero_positions()
+        else:
+            positions = []
+            for i in sorted(rows):
+                positions += [(i,j) for j in index.rows.get(i, {})]
+                positions += [(i,j) for j in index.addable_rows.get(i, ())]
+            positions += self.zero_positions(rows=rows)
+        links = []
+        kept = set()
+        for pos in positions:
+            if not self.in_viewport(pos):
+                continue
+            if pos in self.index.addable:
+                # A directional link to trait 'add_i_j'
+                traitname = self.trait_name('add', pos)
+            else:
+                traitname = self.trait_name('cell', pos)
             child = self.get_child(pos)
-            if child and hasattr(child, 'value') and traitname in self.traits():
-                self.links.append(cdlink((child, 'value'), (self, traitname), self.cast))
+            if not child or not hasattr(child, 'value') or not self.has_trait(traitname):
+                continue
+            lnk = self._links_by_trait.get(traitname)
+            if not lnk or lnk.source[0] is not child:
+                if lnk:
+                    lnk.unlink()
+                lnk = cdlink((child, 'value'), (self, traitname), self.cast)
+                self._links_by_trait[traitname] = lnk
+            kept.add(traitname)
+            links.append(lnk)
+        if rows is None:
+            stale = [traitname for traitname in self._links_by_trait if not traitname in kept]
+        else:
+            stale = [traitname for traitname, lnk in self._links_by_trait.items() if not traitname in kept \
+                     and lnk.source[0].position[0] in rows]
+        for traitname in stale:
+            self._links_by_trait.pop(traitname).unlink()
+        if rows is None:
+            self.links = links
+        else:
+            self.links = list(self._links_by_trait.values())
+
+    def reset_links(self):
+        r"""
+        Reset all potentially existing links
+        between widget cells and corresponding traits.
+        """
+        super(GridViewWidget, self).reset_links()
+        self._links_by_trait = {}
+
+    def unlink_child(self, child):
+        r"""
+        Remove the link from cell widget `child`
+        to the trait of its current position.
+        """
+        for prefix in ('cell', 'add'):
+            traitname = self.trait_name(prefix, child.position)
+            lnk = self._links_by_trait.get(traitname)
+            if lnk and lnk.source[0] is child:
+                del self._links_by_trait[traitname]
+                lnk.unlink()
 
     def update_style(self, css_classes=None, css_class_index=None):
         r"""
@@ -471,16 +580,104 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             css_classes = self.css_classes
         if not css_class_index:
             css_class_index = self.cell_widget_class_index
-        for row in self.children:
-            for cell in row.children:
-                if not hasattr(cell, 'position') or cell.position is None:
-                    continue # Do we want to change blank cells' style?
+        positions = [(i,j) for i, row in self.index.rows.items() for j in row]
+        with self.batch():
+            for pos in positions + self.index.addable_list: # Do we want to change blank cells' style?
+                cell = self.get_child(pos)
+                if cell is None: # Outside of the viewport
+                    continue
                 for cl in css_classes:
                     cell.remove_class(cl)
-                cell.add_class(css_classes[css_class_index(cell.position)])
+                cell.add_class(css_classes[css_class_index(pos)])
+
+    def compute_slots(self, cell_widget_classes, cell_widget_class_index, rows=None):
+        r"""
+        Compute the layout of the grid, as a list of rows.
+        Each row is a list of slots `(kind, widget_class, pos, display, removable)`
+        where `kind` is one of 'cell', 'addable' or 'blank'.
+        Zero cells of sparse grids are cells inside the viewport,
+        and blanks without a viewport.
+        With a set of rows `rows`, other rows are ``None``.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_widget import GridViewWidget
+            sage: w = GridViewWidget(Partition([2]))
+            sage: [[s[0] for s in row] for row in w.compute_slots(w.cell_widget_classes, w.cell_widget_class_index)]
+            [['cell', 'cell', 'addable'], ['addable']]
+            sage: w.compute_slots(w.cell_widget_classes, w.cell_widget_class_index, rows={1})[0] is None
+            True
+        """
+        index = self.index
+        row0, nrows = (self.viewport or (0, 0, index.total_height))[0::2]
+        displays = {}
+        if rows is None and not self.viewport and hasattr(self.adapter, 'display_cells'): # All at once
+            displays = self.adapter.display_cells(self.value, self.displaytype)
+        slots = []
+        for i in range(row0, min(index.total_height, row0 + nrows)):
+            if rows is not None and not i in rows:
+                slots.append(None)
+                continue
+            slots.append(self.compute_row_slots(i, cell_widget_classes, cell_widget_class_index, displays))
+        return slots
+
+    def compute_row_slots(self, i, cell_widget_classes, cell_widget_class_index, displays={}):
+        r"""
+        Compute the slots of row `i`, see :meth:`compute_slots`.
+        Display values are read from `displays` when there.
+        """
+        index = self.index
+        col0, ncols = (self.viewport or (0, 0, None, None))[1::2]
+        width = index.width(i)
+        if ncols is not None:
+            width = min(width, col0 + ncols)
+        if width <= col0: # Empty row
+            return [('blank', None, (i,col0), None, False)]
+        row = index.rows.get(i, {})
+        row_slots = []
+        for j in range(col0, width):
+            pos = (i,j)
+            if j in row:
+                cell_widget_class = cell_widget_classes[cell_widget_class_index(pos)]
+                if pos in displays:
+                    cell_display = displays[pos]
+                else:
+                    cell_display = self.adapter.cell_to_display(row[j], self.displaytype)
+                row_slots.append(('cell', cell_widget_class, pos, cell_display, index.is_removable(pos)))
+            elif pos in index.addable:
+                row_slots.append(('addable', None, pos, None, False))
+            elif self.viewport and index.kind(pos) == 'zero': # An editable zero
+                cell_widget_class = cell_widget_classes[cell_widget_class_index(pos)]
+                cell_display = self.adapter.cell_to_display(self.adapter.cellzero, self.displaytype)
+                row_slots.append(('cell', cell_widget_class, pos, cell_display, False))
+            else:
+                row_slots.append(('blank', None, pos, None, False))
+        return row_slots
+
+    def make_slot_widget(self, slot, addable_widget_class, blank_widget_class):
+        r"""
+        Build a child widget for slot `slot`.
+        """
+        kind, cell_widget_class, pos, cell_display, removable = slot
+        if kind == 'addable':
+            return addable_widget_class(pos, layout=self.cell_layout)
+        if kind == 'blank':
+            return blank_widget_class(layout=self.cell_layout)
+        cell = cell_widget_class(cell_display,
+                                 pos,
+                                 layout=self.cell_layout,
+                                 placeholder=cell_display)
+        if removable:
+            if issubclass(cell_widget_class, ToggleButtonSingleton):
+                with cell.hold_sync():
+                    cell.description = '-'
+                    cell.disabled = False
+            else:
+                cell.add_class('removablecell')
+        return cell
 
     def draw(self, cell_widget_classes=None, cell_widget_class_index=None,
-             addable_widget_class=None, blank_widget_class=None):
+             addable_widget_class=None, blank_widget_class=None, changed=None):
         r"""
         Add children to the GridWidget:
         - Sage object/grid editor cells
@@ -488,22 +685,46 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
         - Addable cells if any
         Used classes can be passed as arguments
         to enable changing shapes, colors ..
+
+        Children are reconciled with the previous drawing:
+        a child widget whose slot keeps the same kind, class
+        and removability is kept and its value updated in place.
+        Only rows with changed children are reassigned.
+        With a set of rows `changed` (as computed by the editor),
+        other rows are kept as they are, and only the cells
+        of these rows are linked again.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_widget import GridViewWidget
+            sage: w = GridViewWidget(Tableau([[1, 2, 5, 6], [3], [4]]))
+            sage: c, r = w.get_child((2,0)), w.children[2]
+            sage: from traitlets import Bunch
+            sage: w.add_cell(Bunch({'name': 'add_1_1', 'old': 0, 'new': 8, 'owner': w, 'type': 'change'}))
+            sage: w.value
+            [[1, 2, 5, 6], [3, 8], [4]]
+            sage: w.get_child((2,0)) is c, w.children[2] is r
+            (True, True)
+            sage: w.get_child((1,1)).value
+            u'8'
+            sage: w.set_cell(Bunch({'name': 'cell_2_0', 'old': 4, 'new': 7, 'owner': w, 'type': 'change'}))
+            sage: w.get_child((2,0)) is c, c.value
+            (True, u'7')
+            sage: len(w.links)
+            11
+            sage: r0 = w.children[0]
+            sage: w.draw(changed={2})
+            sage: w.children[0] is r0, w.get_child((2,0)) is c
+            (True, True)
+            sage: w.set_value(Tableau([[1, 2, 5, 6], [3, 7]]))
+            sage: [t for t in w._links_by_trait if t.split('_')[1] == '2']
+            ['add_2_0']
+            sage: w.set_value(Tableau([[1, 2, 5, 6]])) # Row 2 is gone
+            sage: [t for t in w._links_by_trait if t.split('_')[1] == '2']
+            []
         """
         self.donottrack = True # Prevent any interactivity while drawing the widget
-        self.reset_links()
         self.compute_height()
-        positions = sorted(list(self.cells.keys()))
-        rows = [[(pos, self.cells[pos]) for pos in positions if pos[0]==i] \
-                for i in range(self.height)]
-        vbox_children = []
-        addable_positions = self.addable_cells()
-        removable_positions = self.removable_cells()
-        addable_rows = {}
-        if addable_positions:
-            addable_rows = {
-                i : [pos for pos in addable_positions if pos[0]==i] \
-                for i in range(max([1+t[0] for t in addable_positions]))
-            }
         if not cell_widget_classes:
             cell_widget_classes = self.cell_widget_classes
         if not cell_widget_class_index:
@@ -512,68 +733,156 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             addable_widget_class = self.addable_widget_class
         if not blank_widget_class:
             blank_widget_class = self.blank_widget_class
-        i, j = -1, -1 # initialization ; necessary for an empty grid
-        for i in range(self.height):
-            r = rows[i]
-            if not r: # Empty row
-                if not addable_rows[i]:
-                    vbox_children.append(HBox((
-                        blank_widget_class(layout=self.cell_layout, disabled=True),
-                    )))
-                    continue
-                hbox_children = []
-                for j in range(max([pos[1]+1 for pos in addable_rows[i]])):
-                    if (i,j) in addable_positions:
-                        hbox_children.append(addable_widget_class((i,j), layout=self.cell_layout))
-                    else:
-                        hbox_children.append(blank_widget_class(layout=self.cell_layout, disabled=True))
-                vbox_children.append(HBox((hbox_children)))
-                continue
-            j = 0
-            hbox_children = []
-            while j<=max([t[0][1] for t in rows[i]]):
-                if (i,j) in positions:
-                    cell_content = self.cells[(i,j)]
-                    cell_widget_class = cell_widget_classes[cell_widget_class_index((i,j))]
-                    cell_display = self.adapter.cell_to_display(cell_content, self.displaytype)
-                    cell = cell_widget_class(cell_display,
-                                             (i,j),
-                                             layout=self.cell_layout,
-                                             placeholder=cell_display)
-                    if (i,j) in removable_positions:
-                        if issubclass(cell_widget_class, ToggleButtonSingleton):
-                            cell.description = '-'
-                            cell.disabled = False
-                        else:
-                            cell.add_class('removablecell')
-                    hbox_children.append(cell)
-                elif (i,j) in addable_positions:
-                    # Inside the grid-represented object limits
-                    hbox_children.append(addable_widget_class((i,j), layout=self.cell_layout))
+        if not hasattr(self, '_drawn_rows'):
+            self.reset_links()
+            self._drawn_rows = []
+            changed = None
+        row0 = (self.viewport or (0,))[0]
+        slots = self.compute_slots(cell_widget_classes, cell_widget_class_index, rows=changed)
+        if changed is not None: # Rows drawn again, and rows gone
+            changed = set(row0 + i for i, row_slots in enumerate(slots)
+                          if row_slots is not None or i >= len(self._drawn_rows))
+            changed.update(range(row0 + len(slots), row0 + len(self._drawn_rows)))
+        with self.batch(rows=changed):
+            drawn_rows = []
+            for i, row_slots in enumerate(slots):
+                if row_slots is None:
+                    if i < len(self._drawn_rows): # Unchanged row
+                        drawn_rows.append(self._drawn_rows[i])
+                        continue
+                    row_slots = self.compute_row_slots(row0 + i, cell_widget_classes, cell_widget_class_index)
+                if i < len(self._drawn_rows):
+                    hbox, old_slots = self._drawn_rows[i]
                 else:
-                    hbox_children.append(blank_widget_class(layout=self.cell_layout))
-                j+=1
-                if addable_positions and \
-                   j > max([t[0][1] for t in rows[i]]) and (i,j) in addable_positions:
-                    # Outside of the grid-represented object limits
-                    hbox_children.append(self.addable_widget_class((i,j), layout=self.cell_layout))
-            vbox_children.append(HBox(hbox_children))
-        for i in addable_rows:
-            if i >= self.height:
-                row = addable_rows[i]
-                hbox_children = []
-                for j in range(max([(pos[1]+1) for pos in row])):
-                    if (i,j) in row:
-                        hbox_children.append(self.addable_widget_class((i,j), layout=self.cell_layout))
-                    else:
-                        hbox_children.append(blank_widget_class(layout=self.cell_layout))
-                vbox_children.append(HBox(hbox_children))
-        if self.display_convention == 'fr':
-            vbox_children.reverse()
-        self.children = vbox_children
-        self.add_links()
+                    hbox, old_slots = None, []
+                drawn_slots = []
+                for j, slot in enumerate(row_slots):
+                    kind, cell_widget_class, pos, cell_display, removable = slot
+                    key = (kind, cell_widget_class, removable)
+                    if kind == 'addable':
+                        key = (kind, addable_widget_class)
+                    elif kind == 'blank':
+                        key = (kind, blank_widget_class)
+                    cell = None
+                    if j < len(old_slots) and old_slots[j][0] == key:
+                        cell = old_slots[j][1]
+                        if kind != 'blank' and cell.position != pos: # Viewport moved
+                            self.unlink_child(cell)
+                            cell.position = pos
+                            if kind == 'cell' and isinstance(cell, ButtonCell):
+                                cell.set_tooltip()
+                        if kind == 'addable' and cell.value: # Leftover from a failed addition
+                            cell = None
+                        elif kind == 'cell' and cell.value != cell_display:
+                            cell.value = cell_display
+                            if hasattr(cell, 'placeholder'):
+                                cell.placeholder = cell_display
+                    if cell is None:
+                        cell = self.make_slot_widget(slot, addable_widget_class, blank_widget_class)
+                    drawn_slots.append((key, cell))
+                cells = tuple(t[1] for t in drawn_slots)
+                if hbox is None:
+                    hbox = HBox(cells)
+                elif len(cells) != len(hbox.children) \
+                     or any(c1 is not c2 for c1, c2 in zip(cells, hbox.children)):
+                    hbox.children = cells
+                drawn_rows.append((hbox, drawn_slots))
+            self._drawn_rows = drawn_rows
+            vbox_children = [t[0] for t in drawn_rows]
+            if self.display_convention == 'fr':
+                vbox_children.reverse()
+            if self.viewport:
+                vbox_children.append(self.viewport_controls())
+            if len(vbox_children) != len(self.children) \
+               or any(r1 is not r2 for r1, r2 in zip(vbox_children, self.children)):
+                self.children = vbox_children
+        self.add_links(rows=changed)
         self.donottrack = False
 
+    def viewport_controls(self):
+        r"""
+        Return the box of scroll controls for the viewport,
+        with an updated position label.
+        """
+        if not hasattr(self, '_viewport_controls'):
+            moves = [('\u25b2', -1, 0), ('\u25bc', 1, 0), ('\u25c0', 0, -1), ('\u25b6', 0, 1)]
+            if self.display_convention == 'fr': # Rows go upwards
+                moves[0], moves[1] = ('\u25b2', 1, 0), ('\u25bc', -1, 0)
+            buttons = []
+            for description, drows, dcols in moves:
+                b = Button(description=description, layout=buttoncell_smaller_layout)
+                b.on_click(lambda b, drows=drows, dcols=dcols: self.page(drows, dcols))
+                buttons.append(b)
+            self._viewport_label = Label()
+            self._viewport_controls = HBox(buttons + [self._viewport_label])
+        row0, col0, nrows, ncols = self.viewport
+        self._viewport_label.value = "rows %d-%d, columns %d-%d" % (
+            row0, row0 + nrows - 1, col0, col0 + ncols - 1)
+        return self._viewport_controls
+
+    def set_viewport(self, row0, col0, nrows=None, ncols=None):
+        r"""
+        Move the viewport to `(row0, col0)`, possibly resizing it.
+        Cell widgets are reused.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_widget import GridViewWidget
+            sage: w = GridViewWidget(matrix(ZZ, 50, 50, range(2500)), viewport=(0, 0, 5, 4))
+            sage: c, cls = w.get_child((0,0)), w.__class__
+            sage: w.set_viewport(10, 20)
+            sage: w.get_child((0,0)) is None, w.get_child((10,20)) is c
+            (True, True)
+            sage: w.__class__ is cls, w.cell_0_0
+            (True, 520)
+            sage: c.value, c.position
+            (u'520', (10, 20))
+            sage: w.set_viewport(100, 100)
+            sage: w.viewport
+            (45, 46, 5, 4)
+        """
+        nrows = nrows or self.viewport[2]
+        ncols = ncols or self.viewport[3]
+        width = max(self.index.extents.values()) if self.index.extents else 0
+        row0 = max(0, min(row0, self.index.total_height - nrows))
+        col0 = max(0, min(col0, width - ncols))
+        if (row0, col0, nrows, ncols) == self.viewport:
+            return
+        self.reset_dirty()
+        self.viewport = (row0, col0, nrows, ncols)
+        if self.cell_traits:
+            self.compute_traits()
+        self.draw()
+
+    def scroll(self, drows=0, dcols=0):
+        r"""
+        Scroll the viewport by `drows` rows and `dcols` columns.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_widget import GridViewWidget
+            sage: w = GridViewWidget(matrix(ZZ, 50, 50, range(2500)), viewport=(0, 0, 5, 4))
+            sage: w.scroll(2, 1)
+            sage: w.viewport
+            (2, 1, 5, 4)
+        """
+        row0, col0 = self.viewport[:2]
+        self.set_viewport(row0 + drows, col0 + dcols)
+
+    def page(self, drows=0, dcols=0):
+        r"""
+        Scroll the viewport by `drows` pages down and `dcols` pages right.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.grid_view_widget import GridViewWidget
+            sage: w = GridViewWidget(matrix(ZZ, 50, 50, range(2500)), viewport=(0, 0, 5, 4))
+            sage: w.page(1, 2)
+            sage: w.viewport
+            (5, 8, 5, 4)
+        """
+        self.scroll(drows * self.viewport[2], dcols * self.viewport[3])
+
     def disallow_inside_focus(self):
         r"""
         Disallow focus for all cells except the first.
@@ -599,10 +908,15 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             sage: w2 = GridViewWidget(t, display_convention='fr')
             sage: w1.get_child((1,2)).value == w2.get_child((1,2)).value
             True
+            sage: w1.get_child((1,5)) is None
+            True
         """
-        if self.display_convention == 'fr':
-            return self.children[self.total_height - pos[0] - 1].children[pos[1]]
-        return self.children[pos[0]].children[pos[1]]
+        if not self.in_viewport(pos) or pos[1] >= self.index.width(pos[0]):
+            return
+        row0, col0 = (self.viewport or (0, 0))[:2]
+        if pos[0] - row0 >= len(self._drawn_rows):
+            return
+        return self._drawn_rows[pos[0] - row0][1][pos[1] - col0][1]
 
     def set_dirty(self, pos, val, err=None):
         r"""
@@ -633,9 +947,12 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
         """
         super(GridViewWidget, self).set_dirty(pos, val, err)
         child = self.get_child(pos)
-        child.add_class('dirty')
-        if err:
-            child.set_tooltip(self.dirty_info(pos))
+        if child is None: # Out of the viewport
+            return
+        with child.hold_sync():
+            child.add_class('dirty')
+            if err:
+                child.set_tooltip(self.dirty_info(pos))
 
     def unset_dirty(self, pos):
         r"""
@@ -667,8 +984,28 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
         """
         super(GridViewWidget, self).unset_dirty(pos)
         child = self.get_child(pos)
-        child.remove_class('dirty')
-        child.set_tooltip()
+        if child is None: # Out of the viewport
+            return
+        with child.hold_sync():
+            child.remove_class('dirty')
+            child.set_tooltip()
+
+    def set_pending(self, pos):
+        r"""
+        Mark cell #pos as waiting for validation.
+        """
+        super(GridViewWidget, self).set_pending(pos)
+        child = self.get_child(pos)
+        if child:
+            child.add_class('pending')
+
+    def unset_pending(self, pos):
+        r"""
+        Cell #pos is no more waiting for validation.
+        """
+        child = self.get_child(pos)
+        if child:
+            child.remove_class('pending')
 
     def reset_dirty(self):
         r"""
@@ -696,10 +1033,16 @@ class GridViewWidget(GridViewEditor, VBox, ValueWidget):
             sage: w.children[2].children[0]._tooltip
             ''
         """
-        for pos in self.dirty:
-            child = self.get_child(pos)
-            child.remove_class('dirty')
-            child.set_tooltip()
+        if not self.dirty:
+            return
+        with ExitStack() as stack: # Hold sync on dirty cells only
+            for pos in self.dirty:
+                child = self.get_child(pos)
+                if child is None: # Out of the viewport
+                    continue
+                stack.enter_context(child.hold_sync())
+                child.remove_class('dirty')
+                child.set_tooltip()
         super(GridViewWidget, self).reset_dirty()
 
 def PartitionGridViewWidget(obj, display_convention='en'):
@@ -723,7 +1066,7 @@ def PartitionGridViewWidget(obj, display_convention='en'):
         display_convention=display_convention
     )
     def cell_widget_class_index(x):
-        if x in w.removable_cells():
+        if w.is_removable(x):
             return 1
         return 0
     w.cell_widget_class_index = cell_widget_class_index
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+r"""
+Undo / redo history for grid editors.
+
+History entries are either cell deltas -- a tuple of
+``(position, old value, new value)`` changes, where a missing cell
+stands for an added or removed one -- or full snapshots of an object,
+for edits that move most cells around (e.g. inserting a row).
+The history is bounded by an estimated memory budget, in bytes,
+rather than by a number of entries.
+
+EXAMPLES ::
+
+    sage: from sage_combinat_widgets.history import EditHistory, CellDelta, diff_cells
+    sage: h = EditHistory(budget=10**6)
+    sage: d = diff_cells({(0,0): 1, (0,1): 2}, {(0,0): 1, (0,1): 3, (1,0): 4})
+    sage: d
+    CellDelta([((0, 1), 2, 3), ((1, 0), <absent>, 4)])
+    sage: h.record(d)
+    sage: len(h), h.can_undo(), h.can_redo()
+    (1, True, False)
+    sage: d.revert({(0,0): 1, (0,1): 3, (1,0): 4})
+    {(0, 0): 1, (0, 1): 2}
+
+AUTHORS ::
+
+    Odile Bénassy, Nicolas Thiéry
+
+"""
+import sys
+from collections import deque
+
+DEFAULT_HISTORY_BUDGET = 2**22 # 4 MB
+
+
+class _Absent(object):
+    r"""
+    Marker for a cell that does not exist (before an addition,
+    or after a removal).
+    """
+    def __repr__(self):
+        return '<absent>'
+
+ABSENT = _Absent()
+
+
+def estimate_size(x):
+    r"""
+    A rough estimate of the memory used by `x`, in bytes.
+    Containers are walked; other objects are measured shallowly.
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.history import estimate_size
+        sage: estimate_size({(0,0): 1}) > estimate_size({})
+        True
+    """
+    size = sys.getsizeof(x)
+    if isinstance(x, dict):
+        for k, v in x.items():
+            size += estimate_size(k) + estimate_size(v)
+    elif isinstance(x, (tuple, list)):
+        for v in x:
+            size += estimate_size(v)
+    return size
+
+
+class CellDelta(object):
+    r"""
+    A history entry made of cell changes.
+
+    INPUT:
+
+        - ``changes`` -- a tuple of ``(pos, old, new)``; ``old`` or ``new``
+          may be ``ABSENT``
+    """
+    __slots__ = ('changes', 'nbytes')
+
+    def __init__(self, changes):
+        self.changes = tuple(changes)
+        self.nbytes = estimate_size(self.changes)
+
+    def __repr__(self):
+        return "CellDelta(%s)" % list(self.changes)
+
+    def revert(self, cells):
+        r"""
+        From the cells dictionary `cells` after the change,
+        return the cells dictionary before the change.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.history import CellDelta, ABSENT
+            sage: d = CellDelta([((0,1), 5, 7), ((1,0), ABSENT, 3), ((2,0), 4, ABSENT)])
+            sage: d.revert({(0,0): 1, (0,1): 7, (1,0): 3})
+            {(0, 0): 1, (0, 1): 5, (2, 0): 4}
+        """
+        cells = dict(cells)
+        for pos, old, new in self.changes:
+            if old is ABSENT:
+                cells.pop(pos, None)
+            else:
+                cells[pos] = old
+        return cells
+
+    def inverse(self):
+        r"""
+        Return the delta that undoes this one.
+
+        TESTS ::
+
+            sage: from sage_combinat_widgets.history import CellDelta, ABSENT
+            sage: CellDelta([((0,1), 5, 7), ((1,0), ABSENT, 3)]).inverse()
+            CellDelta([((0, 1), 7, 5), ((1, 0), 3, <absent>)])
+        """
+        return CellDelta((pos, new, old) for pos, old, new in self.changes)
+
+
+class Snapshot(object):
+    r"""
+    A history entry holding a whole object.
+
+    INPUT:
+
+        - ``obj`` -- the object to restore
+        - ``cells`` -- its cells dictionary, used to estimate its size
+          (without it, only the object itself is measured, shallowly)
+    """
+    __slots__ = ('obj', 'nbytes')
+
+    def __init__(self, obj, cells=None):
+        self.obj = obj
+        if cells is None:
+            self.nbytes = sys.getsizeof(obj)
+        else:
+            self.nbytes = sys.getsizeof(obj) + estimate_size(cells)
+
+    def __repr__(self):
+        return "Snapshot(%s)" % repr(self.obj)
+
+
+def diff_cells(old_cells, new_cells):
+    r"""
+    Return a `CellDelta` from cells dictionary `old_cells` to `new_cells`.
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.history import diff_cells
+        sage: diff_cells({(0,0): 1, (1,0): 2}, {(0,0): 1})
+        CellDelta([((1, 0), 2, <absent>)])
+        sage: diff_cells({(0,0): 1}, {(0,0): 1})
+        CellDelta([])
+    """
+    changes = []
+    for pos, old in old_cells.items():
+        if pos not in new_cells:
+            changes.append((pos, old, ABSENT))
+            continue
+        new = new_cells[pos]
+        if new is not old and new != old:
+            changes.append((pos, old, new))
+    for pos, new in new_cells.items():
+        if pos not in old_cells:
+            changes.append((pos, ABSENT, new))
+    return CellDelta(sorted(changes, key=lambda c: c[0]))
+
+
+class EditHistory(object):
+    r"""
+    Undo and redo stacks, bounded by a memory budget.
+
+    Once the estimated size of all entries exceeds ``budget`` bytes,
+    the oldest undo entries are dropped, then the farthest redo entries.
+    The last undo entry and the next redo entry are always kept.
+
+    TESTS ::
+
+        sage: from sage_combinat_widgets.history import EditHistory, Snapshot
+        sage: h = EditHistory(budget=1)
+        sage: h.record(Snapshot(1))
+        sage: h.record(Snapshot(2))
+        sage: len(h), h.pop_undo()
+        (1, Snapshot(2))
+        sage: h.pop_undo() is None
+        True
+        sage: h.push_redo(Snapshot(3)); h.push_redo(Snapshot(4))
+        sage: h.pop_redo(), h.pop_redo()
+        (Snapshot(4), None)
+    """
+    def __init__(self, budget=DEFAULT_HISTORY_BUDGET):
+        self.budget = budget
+        self.nbytes = 0
+        self._undo = deque()
+        self._redo = deque()
+
+    def __len__(self):
+        return len(self._undo)
+
+    def __iter__(self):
+        return iter(self._undo)
+
+    def __repr__(self):
+        return "EditHistory(%s undo, %s redo, %s bytes)" % (len(self._undo), len(self._redo), self.nbytes)
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self.nbytes = 0
+
+    def record(self, entry):
+        r"""
+        Record a new edit. This discards the redo stack.
+        """
+        for e in self._redo:
+            self.nbytes -= e.nbytes
+        self._redo.clear()
+        self.push_undo(entry)
+
+    def push_undo(self, entry):
+        self._undo.append(entry)
+        self.nbytes += entry.nbytes
+        self.trim()
+
+    def push_redo(self, entry):
+        self._redo.append(entry)
+        self.nbytes += entry.nbytes
+        self.trim()
+
+    def pop_undo(self):
+        r"""
+        Pop the last undo entry, or return ``None``.
+        """
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self.nbytes -= entry.nbytes
+        return entry
+
+    def pop_redo(self):
+        r"""
+        Pop the last redo entry, or return ``None``.
+        """
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self.nbytes -= entry.nbytes
+        return entry
+
+    def trim(self):
+        r"""
+        Drop the oldest undo entries, then the farthest redo entries,
+        until within budget.
+        """
+        while self.nbytes > self.budget and len(self._undo) > 1:
+            self.nbytes -= self._undo.popleft().nbytes
+        while self.nbytes > self.budget and len(self._redo) > 1:
+            self.nbytes -= self._redo.popleft().nbytes
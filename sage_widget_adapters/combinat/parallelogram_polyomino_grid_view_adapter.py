@@ -14,6 +14,7 @@ Grid View Adapter for parallelogram polyominos
     :meth:`~ParallelogramPolyominoGridViewAdapter.removable_cells` | List removable cells
     :meth:`~ParallelogramPolyominoGridViewAdapter.add_cell` | Add a cell
     :meth:`~ParallelogramPolyominoGridViewAdapter.remove_cell` | Remove a cell
+    :meth:`~ParallelogramPolyominoGridViewAdapter.update_cells` | Update parallelogram polyomino cells after adding or removing a cell
 
 AUTHORS ::
 
@@ -23,6 +24,127 @@ AUTHORS ::
 from sage.combinat.parallelogram_polyomino import ParallelogramPolyomino
 from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
 
+
+class PolyominoShape(object):
+    r"""
+    The upper and lower heights of the columns of a parallelogram polyomino,
+    with its upper and lower paths.
+    Adding or removing a cell changes the heights of one column
+    and a step or two of the paths: the other columns are left as they are.
+
+    TESTS ::
+
+        sage: from sage.combinat.parallelogram_polyomino import ParallelogramPolyomino
+        sage: from sage_widget_adapters.combinat.parallelogram_polyomino_grid_view_adapter import polyomino_shape
+        sage: pp = ParallelogramPolyomino([[0, 1, 0, 1], [1, 1, 0, 0]])
+        sage: s = polyomino_shape(pp)
+        sage: s
+        PolyominoShape(upper=[0, 0], lower=[1, 2])
+        sage: s.geometry() == pp.geometry()
+        True
+        sage: t = s.added((1, 0))
+        sage: t, t.lower_path, t.upper_path
+        (PolyominoShape(upper=[0, 0], lower=[2, 2]), [0, 0, 1, 1], [1, 1, 0, 0])
+        sage: t.removed((1, 0)).lower_path
+        [0, 1, 0, 1]
+        sage: u = s.added((1, 2))
+        sage: u.geometry(), ParallelogramPolyomino([u.lower_path, u.upper_path]).upper_heights()
+        ((2, 3), [0, 0, 1])
+    """
+    __slots__ = ('upper', 'lower', 'upper_path', 'lower_path')
+
+    def __init__(self, upper, lower, upper_path, lower_path):
+        self.upper = upper
+        self.lower = lower
+        self.upper_path = upper_path
+        self.lower_path = lower_path
+
+    def __repr__(self):
+        return "PolyominoShape(upper=%s, lower=%s)" % (self.upper, self.lower)
+
+    def geometry(self):
+        r"""
+        Return the pair (height, width).
+        """
+        return self.lower[-1], len(self.upper)
+
+    def copy(self):
+        return PolyominoShape(list(self.upper), list(self.lower),
+                              list(self.upper_path), list(self.lower_path))
+
+    def added(self, pos):
+        r"""
+        Return the shape with an added cell at addable position `pos`.
+        """
+        s = self.copy()
+        height, width = self.geometry()
+        i, j = pos
+        if i < height and j < width:
+            index = i + j
+            if s.upper[j] == i + 1:
+                s.upper_path[index:index+2] = [1,0]
+                s.upper[j] = i
+            if s.lower[j] == i:
+                s.lower_path[index:index+2] = [0,1]
+                s.lower[j] = i + 1
+        else:
+            if i == height:
+                s.lower_path[-1:] = [0,1]
+                s.upper_path.append(0)
+                s.lower[-1] = height + 1
+            else:
+                s.lower_path.append(1)
+                s.upper_path[-1:] = [1,0]
+                s.upper.append(height - 1)
+                s.lower.append(height)
+        return s
+
+    def removed(self, pos):
+        r"""
+        Return the shape without the cell at removable position `pos`.
+        """
+        s = self.copy()
+        i, j = pos
+        index = i + j
+        if len(s.upper) != j + 1:
+            if s.upper[j] == i:
+                s.upper_path[index:index+2] = [0,1]
+                s.upper[j] = i + 1
+            if s.lower[j] - 1 == i:
+                s.lower_path[index:index+2] = [1,0]
+                s.lower[j] = i
+        else:
+            if s.upper[j] != i and s.lower[j] - 1 == i:
+                s.lower_path[index:index+2] = [1]
+                s.upper_path.pop()
+                s.lower[j] = i
+            elif s.lower[j] - 1 == i:
+                s.lower_path.pop()
+                s.upper_path[index:index+2] = [0]
+                s.upper.pop()
+                s.lower.pop()
+            else:
+                s.upper_path[index:index+2] = [0,1]
+                s.upper[j] = i + 1
+        return s
+
+
+def polyomino_shape(obj):
+    r"""
+    Return the `PolyominoShape` of parallelogram polyomino `obj`.
+    Polyominoes are immutable: the shape is cached on the polyomino.
+    """
+    s = getattr(obj, '_grid_shape', None)
+    if s is None:
+        s = PolyominoShape(list(obj.upper_heights()), list(obj.lower_heights()),
+                           list(obj.upper_path()), list(obj.lower_path()))
+        try:
+            obj._grid_shape = s
+        except AttributeError:
+            pass
+    return s
+
+
 class ParallelogramPolyominoGridViewAdapter(GridViewAdapter):
     r"""
     Grid view adapter for parallelogram polyominos.
@@ -51,9 +173,10 @@ class ParallelogramPolyominoGridViewAdapter(GridViewAdapter):
             {(0, 0): True, (0, 1): True}
         """
         cells = {}
-        lower_heights = obj.lower_heights()
-        upper_heights = obj.upper_heights()
-        for i in range(obj.width()):
+        shape = polyomino_shape(obj)
+        lower_heights = shape.lower
+        upper_heights = shape.upper
+        for i in range(len(upper_heights)):
             for j in range(upper_heights[i],lower_heights[i]):
                 cells[j,i] = True
         return cells
@@ -72,18 +195,19 @@ class ParallelogramPolyominoGridViewAdapter(GridViewAdapter):
             [(1, 0), (2, 1), (1, 2)]
         """
         cells = []
+        shape = polyomino_shape(obj)
 
-        upper_heights = obj.upper_heights()
+        upper_heights = shape.upper
         for i,c in enumerate(upper_heights[1:]):
             if c != upper_heights[i]:
                 cells.append((c-1,i+1))
 
-        lower_heights = obj.lower_heights()
+        lower_heights = shape.lower
         for i,c in enumerate(lower_heights[1:]):
             if c != lower_heights[i]:
                 cells.append((lower_heights[i],i))
 
-        height, width = obj.geometry()
+        height, width = shape.geometry()
         cells += [(height,width-1), (height-1,width)]
 
         return cells
@@ -101,7 +225,8 @@ class ParallelogramPolyominoGridViewAdapter(GridViewAdapter):
             sage: ParallelogramPolyominoGridViewAdapter.removable_cells(pp)
             [(1, 0), (0, 1)]
         """
-        heights = [(0,0)] + list(zip(obj.upper_heights(),obj.lower_heights()))
+        shape = polyomino_shape(obj)
+        heights = [(0,0)] + list(zip(shape.upper, shape.lower))
         heights.append((heights[-1][1],)*2)
         cells = []
         for i in range(1,len(heights)-1):
@@ -140,30 +265,7 @@ class ParallelogramPolyominoGridViewAdapter(GridViewAdapter):
         """
         if pos not in self.addable_cells(obj):
             raise ValueError("Cell position '%s' is not addable." % str(pos))
-
-        heights = list(zip(obj.upper_heights(),obj.lower_heights()))
-
-        upper_path = obj.upper_path()
-        lower_path = obj.lower_path()
-
-        height, width = obj.geometry()
-
-        i,j = pos
-        if i < height and j < width:
-            index = i+j
-            if heights[j][0] == i+1:
-                upper_path[index:index+2] = [1,0]
-            if heights[j][1] == i:
-                lower_path[index:index+2] = [0,1]
-        else:
-            if i == height:
-                lower_path[-1:] = [0,1]
-                upper_path += [0]
-            else:
-                lower_path += [1]
-                upper_path[-1:] = [1,0]
-
-        return ParallelogramPolyomino([lower_path, upper_path])
+        return self.edit_cell(obj, pos, polyomino_shape(obj).added(pos))
 
     def remove_cell(self, obj, pos, dirty={}):
         r"""
@@ -184,27 +286,59 @@ class ParallelogramPolyominoGridViewAdapter(GridViewAdapter):
         """
         if pos not in self.removable_cells(obj):
             raise ValueError("Cell position '%s' is not removable." % str(pos))
+        return self.edit_cell(obj, pos, polyomino_shape(obj).removed(pos))
 
-        heights = list(zip(obj.upper_heights(),obj.lower_heights()))
-        upper_path = obj.upper_path()
-        lower_path = obj.lower_path()
-        i,j = pos
-        index = i+j
-
-        if len(heights) != j+1:
-            if heights[j][0] == i:
-                upper_path[index:index+2] = [0,1]
-            if heights[j][1]-1 == i:
-                lower_path[index:index+2] = [1,0]
-        else:
-            if heights[j][0] != i and heights[j][1]-1 == i:
-                lower_path[index:index+2] = [1]
-                upper_path.pop()
-            elif heights[j][1]-1 == i:
-                lower_path.pop()
-                upper_path[index:index+2] = [0]
-            else:
-                upper_path[index:index+2] = [0,1]
+    def edit_cell(self, obj, pos, shape):
+        r"""
+        Return the parallelogram polyomino with the given shape,
+        obtained from `obj` by adding or removing the cell at `pos`.
+        Remember this edit for `update_cells`.
+        """
+        result = self.objclass([shape.lower_path, shape.upper_path])
+        try:
+            result._grid_shape = shape
+        except AttributeError:
+            pass
+        self._last_edit = (obj, result, pos)
+        return result
+
+    def update_cells(self, cells, old_obj, new_obj):
+        r"""
+        When parallelogram polyomino `new_obj` was obtained from `old_obj`
+        by this adapter's last edit, return the updated cells dictionary.
+        The edited object may be a copy of `old_obj`, as in the editor:
+        they are then compared by value.
 
-        return ParallelogramPolyomino([lower_path, upper_path])
+        TESTS ::
 
+            sage: from sage.combinat.parallelogram_polyomino import ParallelogramPolyomino
+            sage: from sage_widget_adapters.combinat.parallelogram_polyomino_grid_view_adapter import ParallelogramPolyominoGridViewAdapter
+            sage: pp = ParallelogramPolyomino([[0, 1, 0, 1], [1, 1, 0, 0]])
+            sage: ppa = ParallelogramPolyominoGridViewAdapter()
+            sage: new_pp = ppa.add_cell(pp, (1, 2))
+            sage: ppa.update_cells(ppa.compute_cells(pp), pp, new_pp) == ppa.compute_cells(new_pp)
+            True
+            sage: pp = ParallelogramPolyomino.from_dyck_word(DyckWords(200).random_element())
+            sage: for k in range(20):
+            ....:     new_pp = ppa.add_cell(pp, ppa.addable_cells(pp)[-1])
+            ....:     assert ppa.update_cells(ppa.compute_cells(pp), pp, new_pp) == ppa.compute_cells(new_pp)
+            ....:     pp = new_pp
+            sage: from sage_widget_adapters.combinat.parallelogram_polyomino_grid_view_adapter import polyomino_shape
+            sage: polyomino_shape(pp).upper == pp.upper_heights() and polyomino_shape(pp).lower == pp.lower_heights()
+            True
+            sage: new_pp = ppa.add_cell(copy(pp), ppa.addable_cells(pp)[0])
+            sage: ppa.update_cells(ppa.compute_cells(pp), pp, new_pp) == ppa.compute_cells(new_pp)
+            True
+        """
+        edit = getattr(self, '_last_edit', None)
+        if edit is None or edit[1] is not new_obj:
+            return None
+        if edit[0] is not old_obj and edit[0] != old_obj:
+            return None
+        cells = dict(cells)
+        pos = edit[2]
+        if pos in cells:
+            del cells[pos]
+        else:
+            cells[pos] = True
+        return cells
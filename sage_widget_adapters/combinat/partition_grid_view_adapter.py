@@ -18,6 +18,7 @@ Grid View Adapter for partitions
     :meth:`~PartitionGridViewAdapter.removable_cells` | List removable cells
     :meth:`~PartitionGridViewAdapter.add_cell` | Add a cell
     :meth:`~PartitionGridViewAdapter.remove_cell` | Remove a cell
+    :meth:`~PartitionGridViewAdapter.update_cells` | Update partition cells after adding or removing a cell
 
 AUTHORS ::
 
@@ -25,9 +26,106 @@ AUTHORS ::
 
 """
 from sage.combinat.partition import Partition
-from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
+from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter, cells_by_row
 from six import text_type
 
+
+class PartitionCorners(object):
+    r"""
+    The corners and outside corners of a partition,
+    as dictionaries { row : column }.
+    After adding or removing a cell, only the rows around
+    the changed row are refreshed.
+
+    TESTS ::
+
+        sage: from sage_widget_adapters.combinat.partition_grid_view_adapter import PartitionCorners
+        sage: c = PartitionCorners([6, 5, 2, 1])
+        sage: c.corner_list(), c.outside_list()
+        ([(0, 5), (1, 4), (2, 1), (3, 0)], [(0, 6), (1, 5), (2, 2), (3, 1), (4, 0)])
+        sage: c.is_corner((2, 1)), c.is_outside_corner((2, 1))
+        (True, False)
+        sage: d = c.updated(3, -1)
+        sage: d.parts, d.corner_list(), d.outside_list()
+        ([6, 5, 2], [(0, 5), (1, 4), (2, 1)], [(0, 6), (1, 5), (2, 2), (3, 0)])
+        sage: d = d.updated(1, 1)
+        sage: d.corner_list() == Partition(d.parts).corners()
+        True
+        sage: d.outside_list() == Partition(d.parts).outside_corners()
+        True
+    """
+    __slots__ = ('parts', 'corners', 'outside')
+
+    def __init__(self, parts, corners=None, outside=None):
+        self.parts = list(parts)
+        if corners is None:
+            self.corners, self.outside = {}, {}
+            self.refresh(range(len(self.parts) + 1))
+        else:
+            self.corners, self.outside = corners, outside
+
+    def refresh(self, rows):
+        r"""
+        Recompute the corner and outside corner of each row in `rows`.
+        """
+        p = self.parts
+        l = len(p)
+        for r in rows:
+            if r < 0:
+                continue
+            if r < l and (r == l - 1 or p[r] > p[r + 1]):
+                self.corners[r] = p[r] - 1
+            else:
+                self.corners.pop(r, None)
+            if r <= l and (r == 0 or p[r - 1] > (p[r] if r < l else 0)):
+                self.outside[r] = p[r] if r < l else 0
+            else:
+                self.outside.pop(r, None)
+
+    def updated(self, i, step):
+        r"""
+        Return the corners of the partition obtained
+        by adding (``step=1``) or removing (``step=-1``)
+        a cell at the end of row `i`.
+        """
+        parts = list(self.parts)
+        if i == len(parts):
+            parts.append(step)
+        else:
+            parts[i] += step
+            if not parts[i]:
+                parts.pop()
+        c = PartitionCorners(parts, dict(self.corners), dict(self.outside))
+        c.refresh(range(i - 1, i + 3))
+        return c
+
+    def is_corner(self, pos):
+        return self.corners.get(pos[0]) == pos[1]
+
+    def is_outside_corner(self, pos):
+        return self.outside.get(pos[0]) == pos[1]
+
+    def corner_list(self):
+        return [(r, self.corners[r]) for r in sorted(self.corners)]
+
+    def outside_list(self):
+        return [(r, self.outside[r]) for r in sorted(self.outside)]
+
+
+def partition_corners(obj):
+    r"""
+    Return the `PartitionCorners` of partition `obj`.
+    Partitions are immutable: they are cached on the partition.
+    """
+    c = getattr(obj, '_grid_corners', None)
+    if c is None:
+        c = PartitionCorners(obj)
+        try:
+            obj._grid_corners = c
+        except AttributeError:
+            pass
+    return c
+
 class PartitionGridViewAdapter(GridViewAdapter):
     r"""
     Grid view adapter for partitions.
@@ -114,8 +212,7 @@ class PartitionGridViewAdapter(GridViewAdapter):
             sage: PartitionGridViewAdapter.from_cells({(0, 0): False, (0, 1): False, (0, 2): True, (0, 3): False, (1, 0): False, (2, 0): True})
             [4, 1, 1]
         """
-        partition_elements = [
-            len([(i, pos[1]) for pos in cells if pos[0] == i]) for i in range(max(pos[0] for pos in cells) + 1)]
+        partition_elements = [len(row) for row in cells_by_row(cells)]
         try:
             return cls.objclass(partition_elements)
         except:
@@ -179,7 +276,7 @@ class PartitionGridViewAdapter(GridViewAdapter):
             sage: PartitionGridViewAdapter.addable_cells(p)
             [(0, 6), (1, 5), (2, 2), (3, 1), (4, 0)]
         """
-        return obj.outside_corners()
+        return partition_corners(obj).outside_list()
 
     @staticmethod
     def removable_cells(obj):
@@ -194,7 +291,7 @@ class PartitionGridViewAdapter(GridViewAdapter):
             sage: PartitionGridViewAdapter.removable_cells(p)
             [(0, 5), (1, 4), (2, 1), (3, 0)]
         """
-        return obj.corners()
+        return partition_corners(obj).corner_list()
 
     def add_cell(self, obj, pos, val=None, dirty={}):
         r"""
@@ -215,12 +312,10 @@ class PartitionGridViewAdapter(GridViewAdapter):
             ...
             ValueError: Cell position '(2, 0)' is not addable.
         """
-        if not pos in self.addable_cells(obj):
+        corners = partition_corners(obj)
+        if not corners.is_outside_corner(pos):
             raise ValueError("Cell position '%s' is not addable." % str(pos))
-        try:
-            return obj.add_cell(pos[0])
-        except Exception as e:
-            return e
+        return self.edit_cell(obj, pos, corners.updated(pos[0], 1))
 
     def remove_cell(self, obj, pos, dirty={}):
         r"""
@@ -239,9 +334,70 @@ class PartitionGridViewAdapter(GridViewAdapter):
             ...
             ValueError: Cell position '(1, 1)' is not removable.
         """
-        if not pos in self.removable_cells(obj):
+        corners = partition_corners(obj)
+        if not corners.is_corner(pos):
             raise ValueError("Cell position '%s' is not removable." % str(pos))
+        return self.edit_cell(obj, pos, corners.updated(pos[0], -1))
+
+    def edit_cell(self, obj, pos, corners):
+        r"""
+        Return the partition with the given corners,
+        obtained from `obj` by adding or removing the cell at `pos`.
+        Remember this edit for `update_cells`.
+        """
         try:
-            return obj.remove_cell(pos[0])
+            result = self.objclass(corners.parts)
         except Exception as e:
             return e
+        try:
+            result._grid_corners = corners
+        except AttributeError:
+            pass
+        self._last_edit = (obj, result, pos)
+        return result
+
+    def update_cells(self, cells, old_obj, new_obj):
+        r"""
+        When partition `new_obj` was obtained from `old_obj`
+        by this adapter's last edit, return the updated cells dictionary.
+        The edited object may be a copy of `old_obj`, as in the editor:
+        they are then compared by value.
+
+        TESTS ::
+
+            sage: from sage.combinat.partition import Partition
+            sage: from sage_widget_adapters.combinat.partition_grid_view_adapter import PartitionGridViewAdapter
+            sage: p = Partition([3, 1])
+            sage: pa = PartitionGridViewAdapter()
+            sage: cells = pa.compute_cells(p)
+            sage: q = pa.add_cell(p, (1, 1))
+            sage: pa.update_cells(cells, p, q) == pa.compute_cells(q)
+            True
+            sage: r = pa.remove_cell(q, (0, 2))
+            sage: pa.update_cells(pa.compute_cells(q), q, r) == pa.compute_cells(r)
+            True
+            sage: pa.update_cells(cells, p, r) is None
+            True
+            sage: from sage_combinat_widgets import GridViewEditor
+            sage: e = GridViewEditor(Partition([3, 1]))
+            sage: e.donottrack = False
+            sage: e.supports_deltas(e.value) # Checked once per class
+            True
+            sage: computed = []
+            sage: e.adapter.compute_cells = lambda obj: computed.append(obj) or PartitionGridViewAdapter.compute_cells(obj)
+            sage: e.apply_add((1,1), True)
+            sage: e.value, computed
+            ([3, 2], [])
+        """
+        edit = getattr(self, '_last_edit', None)
+        if edit is None or edit[1] is not new_obj:
+            return None
+        if edit[0] is not old_obj and edit[0] != old_obj:
+            return None
+        cells = dict(cells)
+        pos = edit[2]
+        if pos in cells:
+            del cells[pos]
+        else:
+            cells[pos] = self.cellzero
+        return cells
@@ -18,6 +18,7 @@ Grid View Adapter for skew partitions
     :meth:`~SkewPartitionGridViewAdapter.removable_cells` | List removable cells
     :meth:`~SkewPartitionGridViewAdapter.add_cell` | Add a cell
     :meth:`~SkewPartitionGridViewAdapter.remove_cell` | Remove a cell
+    :meth:`~SkewPartitionGridViewAdapter.update_cells` | Update skew partition cells after adding or removing a cell
 
 AUTHORS ::
 
@@ -25,10 +26,27 @@ AUTHORS ::
 
 """
 from sage.combinat.skew_partition import SkewPartition
-from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
+from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter, cells_by_row
+from sage_widget_adapters.combinat.partition_grid_view_adapter import PartitionCorners
 from six import text_type
 
 
+def skew_corners(obj):
+    r"""
+    Return the pair of `PartitionCorners` of the inner
+    and outer partitions of skew partition `obj`.
+    Skew partitions are immutable: they are cached on the skew partition.
+    """
+    c = getattr(obj, '_grid_corners', None)
+    if c is None:
+        c = (PartitionCorners(obj.inner()), PartitionCorners(obj.outer()))
+        try:
+            obj._grid_corners = c
+        except AttributeError:
+            pass
+    return c
+
+
 class SkewPartitionGridViewAdapter(GridViewAdapter):
     r"""
     Grid view adapter for skew partitions.
@@ -108,10 +126,9 @@ class SkewPartitionGridViewAdapter(GridViewAdapter):
             sage: SkewPartitionGridViewAdapter.from_cells({(0, 2): False, (0, 3): False, (1, 1): False, (2, 0): False})
             [4, 2, 1] / [2, 1]
         """
-        height = max([pos[0] for pos in cells]) + 1
-        outer = [max([pos[1] for pos in cells if pos[0]==i]) + 1 for i in range(height)]
-        inner = [min([pos[1] for pos in cells if pos[0]==i]) for i in \
-                 range(height) if min([pos[1] for pos in cells if pos[0]==i]) > 0]
+        rows = cells_by_row(cells)
+        outer = [max(row) + 1 for row in rows]
+        inner = [min(row) for row in rows if min(row) > 0]
         try:
             return cls.objclass([outer,inner])
         except:
@@ -177,7 +194,8 @@ class SkewPartitionGridViewAdapter(GridViewAdapter):
             sage: SkewPartitionGridViewAdapter.addable_cells(sp)
             [(0, 1), (1, 0), (0, 4), (1, 2), (2, 1), (3, 0)]
         """
-        return obj.inner().corners() + obj.outer().outside_corners()
+        inner, outer = skew_corners(obj)
+        return inner.corner_list() + outer.outside_list()
 
     @staticmethod
     def removable_cells(obj):
@@ -193,9 +211,10 @@ class SkewPartitionGridViewAdapter(GridViewAdapter):
             sage: SkewPartitionGridViewAdapter.removable_cells(SkewPartition([[7, 4, 2, 1],[2, 1, 1]]))
             [(0, 2), (1, 1), (3, 0), (0, 6), (1, 3), (2, 1)]
         """
-        ret = obj.inner().outside_corners()
-        for c in obj.outer().corners():
-            if not c in ret:
+        inner, outer = skew_corners(obj)
+        ret = inner.outside_list()
+        for c in outer.corner_list():
+            if not inner.is_outside_corner(c):
                 ret.append(c)
         return ret
 
@@ -220,13 +239,15 @@ class SkewPartitionGridViewAdapter(GridViewAdapter):
             ...
             ValueError: Cell position '(2, 3)' is not addable.
         """
-        if not pos in self.addable_cells(obj):
+        inner, outer = skew_corners(obj)
+        if outer.is_outside_corner(pos):
+            corners = (inner, outer.updated(pos[0], 1))
+        elif inner.is_corner(pos):
+            corners = (inner.updated(pos[0], -1), outer)
+        else:
             raise ValueError("Cell position '%s' is not addable." % str(pos))
         try:
-            if pos in obj.outer().outside_corners():
-                return self.objclass([obj.outer().add_cell(pos[0]), obj.inner()])
-            else:
-                return self.objclass([obj.outer(), obj.inner().remove_cell(pos[0])])
+            return self.edit_cell(obj, pos, corners)
         except:
             raise ValueError("Error adding cell %s to %s" % (pos, self.objclass))
 
@@ -249,12 +270,61 @@ class SkewPartitionGridViewAdapter(GridViewAdapter):
             ...
             ValueError: Cell position '(1, 2)' is not removable.
         """
-        if not pos in self.removable_cells(obj):
+        inner, outer = skew_corners(obj)
+        if outer.is_corner(pos):
+            corners = (inner, outer.updated(pos[0], -1))
+        elif inner.is_outside_corner(pos):
+            corners = (inner.updated(pos[0], 1), outer)
+        else:
             raise ValueError("Cell position '%s' is not removable." % str(pos))
         try:
-            if pos in obj.outer().corners():
-                return self.objclass([obj.outer().remove_cell(pos[0]), obj.inner()])
-            else:
-                return self.objclass([obj.outer(), obj.inner().add_cell(pos[0])])
+            return self.edit_cell(obj, pos, corners)
         except:
             raise ValueError("Error removing cell %s from %s" % (pos, self.objclass))
+
+    def edit_cell(self, obj, pos, corners):
+        r"""
+        Return the skew partition with the given inner and outer corners,
+        obtained from `obj` by adding or removing the cell at `pos`.
+        Remember this edit for `update_cells`.
+        """
+        result = self.objclass([corners[1].parts, corners[0].parts])
+        try:
+            result._grid_corners = corners
+        except AttributeError:
+            pass
+        self._last_edit = (obj, result, pos)
+        return result
+
+    def update_cells(self, cells, old_obj, new_obj):
+        r"""
+        When skew partition `new_obj` was obtained from `old_obj`
+        by this adapter's last edit, return the updated cells dictionary.
+        The edited object may be a copy of `old_obj`, as in the editor:
+        they are then compared by value.
+
+        TESTS ::
+
+            sage: from sage.combinat.skew_partition import SkewPartition
+            sage: from sage_widget_adapters.combinat.skew_partition_grid_view_adapter import SkewPartitionGridViewAdapter
+            sage: sp = SkewPartition([[7, 4, 2, 1],[2, 1, 1]])
+            sage: spa = SkewPartitionGridViewAdapter()
+            sage: new_sp = spa.add_cell(sp, (2, 0))
+            sage: spa.update_cells(spa.compute_cells(sp), sp, new_sp) == spa.compute_cells(new_sp)
+            True
+            sage: newer_sp = spa.remove_cell(new_sp, (0, 6))
+            sage: spa.update_cells(spa.compute_cells(new_sp), new_sp, newer_sp) == spa.compute_cells(newer_sp)
+            True
+        """
+        edit = getattr(self, '_last_edit', None)
+        if edit is None or edit[1] is not new_obj:
+            return None
+        if edit[0] is not old_obj and edit[0] != old_obj:
+            return None
+        cells = dict(cells)
+        pos = edit[2]
+        if pos in cells:
+            del cells[pos]
+        else:
+            cells[pos] = self.cellzero
+        return cells
@@ -23,7 +23,7 @@ AUTHORS ::
 """
 from sage.combinat.skew_tableau import SkewTableau
 from sage.rings.integer import Integer
-from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
+from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter, cells_by_row
 
 
 class SkewTableauGridViewAdapter(GridViewAdapter):
@@ -39,6 +39,7 @@ class SkewTableauGridViewAdapter(GridViewAdapter):
     constructorname = 'SkewTableau'
     celltype = Integer # i.e. sage.rings.integer.Integer
     cellzero = Integer(0)
+    absorbs_dirty = True
 
     @staticmethod
     def compute_cells(obj):
@@ -68,10 +69,11 @@ class SkewTableauGridViewAdapter(GridViewAdapter):
             [[None, 2], [3], [4]]
         """
         rows = []
-        for i in range(max(pos[0] for pos in cells) + 1):
-            rows.append([None] * (max(pos[1] for pos in cells if pos[0] == i) + 1))
-        for pos in cells:
-            rows[pos[0]][pos[1]] = cells[pos]
+        for row in cells_by_row(cells):
+            r = [None] * (max(row) + 1)
+            for j, val in row.items():
+                r[j] = val
+            rows.append(r)
         try:
             return cls.objclass(rows)
         except:
@@ -24,7 +24,7 @@ AUTHORS ::
 """
 from sage.combinat.tableau import Tableau, StandardTableau, SemistandardTableau
 from sage.rings.integer import Integer
-from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
+from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter, cells_by_row
 
 
 class TableauGridViewAdapter(GridViewAdapter):
@@ -40,6 +40,7 @@ class TableauGridViewAdapter(GridViewAdapter):
     constructorname = 'Tableau'
     celltype = Integer # i.e. sage.rings.integer.Integer
     cellzero = Integer(0)
+    absorbs_dirty = True
 
     @staticmethod
     def compute_cells(obj):
@@ -69,15 +70,14 @@ class TableauGridViewAdapter(GridViewAdapter):
             sage: from sage_widget_adapters.combinat.tableau_grid_view_adapter import TableauGridViewAdapter
             sage: TableauGridViewAdapter.from_cells({(0, 0): 1, (0, 1): 2, (0, 2): 5, (0, 3): 6, (1, 0): 3, (2, 0): 4})
             [[1, 2, 5, 6], [3], [4]]
+            sage: TableauGridViewAdapter.from_cells({(0, 1): 1, (0, 0): 2})
+            [[2, 1]]
+            sage: t = StandardTableaux(2000).random_element()
+            sage: TableauGridViewAdapter.from_cells(TableauGridViewAdapter.compute_cells(t)) == t
+            True
         """
-        rows = []
-        i = 0
-        while i <= max(pos[0] for pos in cells):
-            row = [cells[pos] for pos in cells if pos[0] == i]
-            row.sort()
-            rows.append(row)
-            i += 1
         try:
+            rows = [[row[j] for j in range(len(row))] for row in cells_by_row(cells)]
             return cls.objclass(rows)
         except:
             raise TypeError(
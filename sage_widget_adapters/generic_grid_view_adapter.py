@@ -12,6 +12,9 @@ Generic Grid View Adapter
     :meth:`~GridViewAdapter.cell_to_display` | Static method for typecasting cell content to widget display value
     :meth:`~GridViewAdapter.display_to_cell` | Instance method for typecasting widget display value to cell content
     :meth:`~GridViewAdapter.compute_cells` | Compute object cells as a dictionary { coordinate pair : integer }
+    :meth:`~GridViewAdapter.shape` | Grid shape, for sparse grids
+    :meth:`~GridViewAdapter.update_cells` | Update a cells dictionary after an edit
+    :meth:`~GridViewAdapter.copy` | Copy an object before editing it
     :meth:`~GridViewAdapter.from_cells` | Create a new Sage object from a cells dictionary
     :meth:`~GridViewAdapter._validate` | Validate a new object
     :meth:`~GridViewAdapter.get_cell` | Get the object cell content
@@ -33,6 +36,7 @@ AUTHORS ::
 
 """
 import traitlets, sage.all
+from copy import copy
 from sage.all import SageObject
 from sage.misc.abstract_method import abstract_method
 from six import text_type
@@ -54,6 +58,173 @@ def eval_in_main(s):
     except:
         return eval(s, __main__.__dict__)
 
+_constructors = {}
+
+def register_constructor(name, constructor):
+    r"""
+    Register callable `constructor` under name `name`,
+    for use as an adapter `constructorname`.
+    This is how user-defined classes can be made known to adapters
+    without evaluating their name.
+
+    TESTS ::
+
+        sage: from sage_widget_adapters.generic_grid_view_adapter import register_constructor, get_constructor
+        sage: class MyTableau(Tableau):
+        ....:     pass
+        sage: register_constructor('MyTableau', MyTableau)
+        sage: get_constructor('MyTableau') is MyTableau
+        True
+    """
+    _constructors[name] = constructor
+
+def get_constructor(name):
+    r"""
+    Return the constructor called `name`.
+    Names are evaluated once, then cached.
+
+    TESTS ::
+
+        sage: from sage_widget_adapters.generic_grid_view_adapter import get_constructor
+        sage: get_constructor('Tableau')
+        <class 'sage.combinat.tableau.Tableau'>
+        sage: get_constructor('Tableau') is get_constructor('Tableau')
+        True
+    """
+    try:
+        return _constructors[name]
+    except KeyError:
+        pass
+    constructor = eval_in_main(name)
+    _constructors[name] = constructor
+    return constructor
+
+def cells_by_row(cells):
+    r"""
+    From a cells dictionary { coordinates pair : value },
+    return the list of its rows, from row 0 to the last nonempty row.
+    Each row is a dictionary { column index : value }.
+    This is a single pass over `cells`.
+
+    TESTS ::
+
+        sage: from sage_widget_adapters.generic_grid_view_adapter import cells_by_row
+        sage: cells_by_row({(0, 1): 2, (2, 0): 4, (0, 0): 1})
+        [{0: 1, 1: 2}, {}, {0: 4}]
+        sage: cells_by_row({})
+        []
+    """
+    rows = []
+    for (i, j), val in cells.items():
+        while i >= len(rows):
+            rows.append({})
+        rows[i][j] = val
+    return rows
+
+class DirtyOverlay(dict):
+    r"""
+    Pending cell values { coordinates pair : value },
+    that are not valid yet (or not validated yet).
+    Values are also indexed by row, so that they can be applied
+    to an object's list of rows in one ordered pass.
+    Positions always refer to the object cells.
+
+    TESTS ::
+
+        sage: from sage_widget_adapters.generic_grid_view_adapter import DirtyOverlay
+        sage: d = DirtyOverlay({(0,1): 0, (1,2): 42})
+        sage: d[(0,3)] = 0
+        sage: d.rows
+        {0: {1: 0, 3: 0}, 1: {2: 42}}
+        sage: del d[(1,2)]
+        sage: d.rows
+        {0: {1: 0, 3: 0}}
+        sage: d.apply([[1, 2, 5, 6], [3, 7], [4]], 0)
+        [[1, 5], [3, 7], [4]]
+    """
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.rows = {}
+        for pos, val in dict.items(self):
+            self.rows.setdefault(pos[0], {})[pos[1]] = val
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __setitem__(self, pos, val):
+        dict.__setitem__(self, pos, val)
+        self.rows.setdefault(pos[0], {})[pos[1]] = val
+
+    def __delitem__(self, pos):
+        dict.__delitem__(self, pos)
+        row = self.rows[pos[0]]
+        del row[pos[1]]
+        if not row:
+            del self.rows[pos[0]]
+
+    def pop(self, pos, *default):
+        if pos in self:
+            val = dict.__getitem__(self, pos)
+            del self[pos]
+            return val
+        return dict.pop(self, pos, *default)
+
+    def popitem(self):
+        pos, val = dict.popitem(self)
+        dict.__setitem__(self, pos, val)
+        del self[pos]
+        return pos, val
+
+    def setdefault(self, pos, val=None):
+        if pos not in self:
+            self[pos] = val
+        return dict.__getitem__(self, pos)
+
+    def update(self, *args, **kwargs):
+        for pos, val in dict(*args, **kwargs).items():
+            self[pos] = val
+
+    def clear(self):
+        dict.clear(self)
+        self.rows.clear()
+
+    def apply(self, l, cellzero):
+        r"""
+        Apply pending values to list of rows `l` (modified in place).
+        Pending values equal to `cellzero` remove their cells;
+        values just after the end of a row are appended to it.
+        Return the list of non empty rows.
+
+        TESTS ::
+
+            sage: from sage_widget_adapters.generic_grid_view_adapter import DirtyOverlay
+            sage: DirtyOverlay({(0,1): 0, (0,2): 0, (1,2): 8, (1,3): 9}).apply([[1, 2, 5, 6], [3, 7]], 0)
+            [[1, 6], [3, 7, 8, 9]]
+            sage: DirtyOverlay({(3,0): 5, (3,1): 6}).apply([[1, 2], [3]], 0)
+            [[1, 2], [3], [5, 6]]
+        """
+        for i in sorted(self.rows):
+            pending = self.rows[i]
+            if i >= len(l):
+                l.extend([] for k in range(i + 1 - len(l)))
+                l[i] = [pending[j] for j in sorted(pending) if pending[j] != cellzero]
+                continue
+            row = l[i]
+            new_row = []
+            for j, val in enumerate(row):
+                if j in pending:
+                    val = pending[j]
+                    if val == cellzero:
+                        continue
+                new_row.append(val)
+            j = len(row)
+            while j in pending:
+                if pending[j] != cellzero:
+                    new_row.append(pending[j])
+                j += 1
+            l[i] = new_row
+        return [row for row in l if row]
+
 class GridViewAdapter(object):
     r"""
     A generic grid view adapter.
@@ -67,6 +238,7 @@ class GridViewAdapter(object):
         * ``cellzero`` -- cell content zero (to be defined in subclasses)
         * ``addablecelltype`` -- addable cell content zero (to be defined in subclasses) -- by default = celltype
         * ``addablecellzero`` -- addable cell content zero (to be defined in subclasses) -- by default == cellzero
+        * ``absorbs_dirty`` -- whether `set_cell` and `add_cell` apply all their `dirty` values at once
     """
     objclass = SageObject
     constructorname = None
@@ -74,6 +246,14 @@ class GridViewAdapter(object):
     constructorname = None
     addablecelltype = None
     addablecellzero = None
+    absorbs_dirty = False
+
+    @classmethod
+    def for_object(cls, obj):
+        r"""
+        Return an adapter object for Sage object `obj`.
+        """
+        return cls()
 
     @staticmethod
     def cell_to_display(cell_content, display_type=text_type):
@@ -121,11 +301,40 @@ class GridViewAdapter(object):
         return a dictionary { coordinates pair : integer }
         """
 
+    @staticmethod
+    def shape(obj):
+        r"""
+        For sparse grids, where cells only hold nonzero values,
+        return the grid (number of rows, number of columns).
+        Return ``None`` when cells cover the whole grid.
+        """
+        return None
+
+    def update_cells(self, cells, old_obj, new_obj):
+        r"""
+        From the cells dictionary `cells` of object `old_obj`,
+        return the cells dictionary of object `new_obj`
+        when it can be derived from the last edit made by this adapter.
+        Return ``None`` otherwise: cells will then be computed from scratch.
+        `cells` itself is left unchanged.
+        """
+        return None
+
+    @staticmethod
+    def copy(obj):
+        r"""
+        Return a copy of `obj`, to be edited in place.
+        Adapters that cache data on objects may carry it over here.
+        """
+        return copy(obj)
+
     @classmethod
     def _validate(cls, obj, constructorname=''):
         r"""
         From an object `obj`,
         Try to build an object of type `cls`.
+        Objects that already are instances of `objclass`
+        are returned as they are.
 
         TESTS ::
 
@@ -133,14 +342,18 @@ class GridViewAdapter(object):
             sage: assert issubclass(GridViewAdapter._validate(pi).__class__, SageObject)
             sage: from sage.matrix.constructor import matrix
             sage: assert issubclass(GridViewAdapter._validate(pi, constructorname='matrix').__class__, BaseException)
+            sage: from sage_widget_adapters.combinat.tableau_grid_view_adapter import TableauGridViewAdapter
+            sage: t = Tableau([[1, 2], [3]])
+            sage: TableauGridViewAdapter._validate(t) is t
+            True
         """
         try:
             if constructorname:
-                return eval_in_main(constructorname)(obj)
-            if cls.constructorname:
-                return eval_in_main(cls.constructorname)(obj)
-            if issubclass(obj.__class__, cls.objclass):
+                return get_constructor(constructorname)(obj)
+            if isinstance(obj, cls.objclass): # No need to build it again
                 return obj
+            if cls.constructorname:
+                return get_constructor(cls.constructorname)(obj)
             return cls.objclass(obj)
         except Exception as e:
             return e
@@ -197,6 +410,7 @@ class GridViewAdapter(object):
         r"""
         Append 'dirty' values to list 'l'.
         Return a list with no empty values.
+        See :class:`DirtyOverlay`.
 
         TESTS ::
 
@@ -210,20 +424,9 @@ class GridViewAdapter(object):
             sage: ga.make_dirty(t.to_list(), {(2,0):0})
             [[1, 2, 5, 6], [3, 7]]
         """
-        for p in dirty:
-            if p[0] < len(l):
-                if p[1] < len(l[p[0]]):
-                    if dirty[p] == self.cellzero:
-                        del l[p[0]][p[1]]
-                    else:
-                        l[p[0]][p[1]] = dirty[p]
-                elif len(l[p[0]]) == p[1] and dirty[p] != self.cellzero:
-                    l[p[0]].append(dirty[p])
-            else:
-                for i in range(p[0] - len(l)):
-                    l.append([])
-                l.append([dirty[p]])
-        return [val for val in l if val]
+        if not isinstance(dirty, DirtyOverlay):
+            dirty = DirtyOverlay(dirty)
+        return dirty.apply(l, self.cellzero)
 
     def set_cell(self, obj, pos, val, dirty={}, constructorname=''):
         r"""
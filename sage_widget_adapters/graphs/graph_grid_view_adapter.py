@@ -13,7 +13,9 @@ Grid View Adapter for grid-representable graphs
     :meth:`~GraphGridViewAdapter.display_to_cell` | Instance method for typecasting widget display value to cell content
     :meth:`~GraphGridViewAdapter.compute_cells` | Compute graph cells as a dictionary { coordinate pair : label }
     :meth:`~GraphGridViewAdapter.from_cells` | Create a new graph from a cells dictionary
+    :meth:`~GraphGridViewAdapter.grid_edges` | List horizontal and vertical edges between cells
     :meth:`~GraphGridViewAdapter.get_cell` | Get the graph cell content (i.e. None)
+    :meth:`~GraphGridViewAdapter.copy` | Copy a graph, with its cached bounds
     :meth:`~GraphGridViewAdapter.addable_cells` | List addable cells
     :meth:`~GraphGridViewAdapter.removable_cells` | List removable cells
     :meth:`~GraphGridViewAdapter.add_cell` | Add a cell
@@ -28,10 +30,111 @@ AUTHORS ::
     Odile Bénassy, Nicolas Thiéry
 
 """
+from copy import copy
 from sage.graphs.graph import Graph
 from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
 from six import text_type
 
+
+class GridBounds(object):
+    r"""
+    Row and column occupancy counts of a grid graph,
+    with its bounding box ``(row_max, col_max)``.
+    Kept up to date by the adapter as vertices are added or removed,
+    and carried over to the copies made by `GraphGridViewAdapter.copy`.
+
+    TESTS ::
+
+        sage: from sage.graphs.generators.basic import GridGraph
+        sage: from sage_widget_adapters.graphs.graph_grid_view_adapter import GridBounds
+        sage: b = GridBounds(GridGraph((2,3)).vertex_iterator())
+        sage: b
+        GridBounds(row_max=1, col_max=2, order=6)
+        sage: b.remove((1,2)); b.remove((0,2))
+        sage: b
+        GridBounds(row_max=1, col_max=1, order=4)
+        sage: b.add((3,0))
+        sage: b
+        GridBounds(row_max=3, col_max=1, order=5)
+        sage: c = b.copy(); c.remove((3,0))
+        sage: b.row_max, c.row_max
+        (3, 1)
+    """
+    __slots__ = ('rows', 'cols', 'row_max', 'col_max', 'order')
+
+    def __init__(self, vertices=()):
+        self.rows, self.cols = {}, {}
+        self.row_max, self.col_max = 0, 0
+        self.order = 0
+        for v in vertices:
+            self.add(v)
+
+    def copy(self):
+        b = GridBounds()
+        b.rows, b.cols = dict(self.rows), dict(self.cols)
+        b.row_max, b.col_max = self.row_max, self.col_max
+        b.order = self.order
+        return b
+
+    def __repr__(self):
+        return "GridBounds(row_max=%s, col_max=%s, order=%s)" % (self.row_max, self.col_max, self.order)
+
+    def add(self, pos):
+        i, j = pos
+        self.rows[i] = self.rows.get(i, 0) + 1
+        self.cols[j] = self.cols.get(j, 0) + 1
+        if i > self.row_max:
+            self.row_max = i
+        if j > self.col_max:
+            self.col_max = j
+        self.order += 1
+
+    def remove(self, pos):
+        i, j = pos
+        self.rows[i] -= 1
+        if not self.rows[i]:
+            del self.rows[i]
+            if i == self.row_max:
+                self.row_max = max(self.rows) if self.rows else 0
+        self.cols[j] -= 1
+        if not self.cols[j]:
+            del self.cols[j]
+            if j == self.col_max:
+                self.col_max = max(self.cols) if self.cols else 0
+        self.order -= 1
+
+
+def grid_bounds(obj):
+    r"""
+    Return the `GridBounds` of graph `obj`.
+    They are cached on the graph, and maintained by the adapter
+    edits. Graphs changed by other means should drop the cache
+    with ``del obj._grid_bounds``: only a change in the number
+    of vertices is detected.
+
+    TESTS ::
+
+        sage: from sage.graphs.generators.basic import GridGraph
+        sage: from sage_widget_adapters.graphs.graph_grid_view_adapter import grid_bounds
+        sage: g = GridGraph((200,200))
+        sage: grid_bounds(g)
+        GridBounds(row_max=199, col_max=199, order=40000)
+        sage: grid_bounds(g) is grid_bounds(g)
+        True
+        sage: g.delete_vertex((199,199))
+        sage: grid_bounds(g).order
+        39999
+    """
+    b = getattr(obj, '_grid_bounds', None)
+    if b is None or b.order != obj.num_verts():
+        b = GridBounds(obj.vertex_iterator())
+        try:
+            obj._grid_bounds = b
+        except AttributeError:
+            pass
+    return b
+
+
 class GraphGridViewAdapter(GridViewAdapter):
     r"""
     Grid view adapter for grid-representable graphs.
@@ -115,11 +218,40 @@ class GraphGridViewAdapter(GridViewAdapter):
             cells[v] = None
         return cells
 
+    @staticmethod
+    def grid_edges(positions):
+        r"""
+        From an iterable of coordinates pairs,
+        return the list of edges between horizontal
+        and vertical neighbours.
+
+        TESTS ::
+
+            sage: from sage_widget_adapters.graphs.graph_grid_view_adapter import GraphGridViewAdapter
+            sage: sorted(GraphGridViewAdapter.grid_edges([(0,0), (0,1), (1,1), (2,0)]))
+            [((0, 0), (0, 1)), ((0, 1), (1, 1))]
+            sage: from sage.graphs.generators.families import AztecDiamondGraph
+            sage: g = AztecDiamondGraph(30)
+            sage: len(GraphGridViewAdapter.grid_edges(g.vertex_iterator())) == g.num_edges()
+            True
+        """
+        if not isinstance(positions, (set, frozenset, dict)):
+            positions = set(positions)
+        edges = []
+        for pos in positions:
+            i, j = pos
+            if (i, j + 1) in positions:
+                edges.append((pos, (i, j + 1)))
+            if (i + 1, j) in positions:
+                edges.append((pos, (i + 1, j)))
+        return edges
+
     @classmethod
-    def from_cells(cls, cells={}):
+    def from_cells(cls, cells={}, edges=False):
         r"""
         From a dictionary { coordinates pair : None }
-        return a graph with one vertex for every coordinates pair
+        return a graph with one vertex for every coordinates pair.
+        With ``edges=True``, neighbour cells are joined by an edge.
 
         TESTS ::
 
@@ -127,9 +259,17 @@ class GraphGridViewAdapter(GridViewAdapter):
             sage: from sage_widget_adapters.graphs.graph_grid_view_adapter import GraphGridViewAdapter
             sage: GraphGridViewAdapter.from_cells({(0, 0): None, (0, 1): None, (1, 0): None, (1, 1): None, (2, 0): None, (2, 1): None})
             Graph on 6 vertices
+            sage: g = GraphGridViewAdapter.from_cells({(0, 0): None, (0, 1): None, (1, 0): None, (1, 1): None, (2, 0): None, (2, 1): None}, edges=True)
+            sage: g.num_edges()
+            7
+            sage: g = AztecDiamondGraph(30)
+            sage: GraphGridViewAdapter.from_cells(GraphGridViewAdapter.compute_cells(g), edges=True).is_isomorphic(g)
+            True
         """
         g = Graph()
         g.add_vertices(list(cells.keys()))
+        if edges:
+            g.add_edges(cls.grid_edges(cells))
         return cls.objclass(g)
 
     @staticmethod
@@ -148,6 +288,36 @@ class GraphGridViewAdapter(GridViewAdapter):
         """
         return None
 
+    @staticmethod
+    def copy(obj):
+        r"""
+        Return a copy of graph `obj`, with a copy of its cached bounds,
+        so that editing the copy does not walk its vertices again.
+
+        TESTS ::
+
+            sage: from sage.graphs.generators.basic import GridGraph
+            sage: from sage_widget_adapters.graphs.graph_grid_view_adapter import GraphGridViewAdapter, grid_bounds
+            sage: g = GridGraph((1,3))
+            sage: b = grid_bounds(g)
+            sage: h = GraphGridViewAdapter.copy(g)
+            sage: grid_bounds(h) is b, h._grid_bounds.order
+            (False, 3)
+            sage: ga = GraphGridViewAdapter()
+            sage: ga.add_cell(h, (0,3))
+            Grid Graph for [1, 3]: Graph on 4 vertices
+            sage: grid_bounds(h), grid_bounds(g)
+            (GridBounds(row_max=0, col_max=3, order=4), GridBounds(row_max=0, col_max=2, order=3))
+        """
+        new_obj = copy(obj)
+        b = getattr(obj, '_grid_bounds', None)
+        if b is not None and b.order == new_obj.num_verts():
+            try:
+                new_obj._grid_bounds = b.copy()
+            except AttributeError:
+                pass
+        return new_obj
+
     @staticmethod
     def addable_cells(obj):
         r"""
@@ -167,12 +337,10 @@ class GraphGridViewAdapter(GridViewAdapter):
         """
         if not obj.num_verts():
             return [(0,0)]
-        row_max, col_max = 0, 0
-        for t in obj.vertex_iterator():
-            row_max = max(row_max, t[0])
-            col_max = max(col_max, t[1])
-            if row_max > 0 and col_max > 0:
-                return []
+        b = grid_bounds(obj)
+        row_max, col_max = b.row_max, b.col_max
+        if row_max > 0 and col_max > 0:
+            return []
         if row_max > 0:
             return [(row_max + 1, 0)]
         elif col_max > 0:
@@ -196,12 +364,10 @@ class GraphGridViewAdapter(GridViewAdapter):
             sage: GraphGridViewAdapter.removable_cells(g)
             [(0, 2)]
         """
-        row_max, col_max = 0, 0
-        for t in obj.vertex_iterator():
-            row_max = max(row_max, t[0])
-            col_max = max(col_max, t[1])
-            if row_max > 0 and col_max > 0:
-                return []
+        b = grid_bounds(obj)
+        row_max, col_max = b.row_max, b.col_max
+        if row_max > 0 and col_max > 0:
+            return []
         if row_max > 0:
             return [(row_max, 0)]
         elif col_max > 0:
@@ -223,9 +389,11 @@ class GraphGridViewAdapter(GridViewAdapter):
         """
         if not pos in self.addable_cells(obj):
             raise ValueError("Position '%s' is not addable." % str(pos))
-        if pos in obj.vertices():
+        if obj.has_vertex(pos):
             raise ValueError("This cell (position=%s) is already in the graph." % str(pos))
+        b = grid_bounds(obj)
         obj.add_vertex(pos)
+        b.add(pos)
         return obj
 
     def remove_cell(self, obj, pos, dirty={}):
@@ -243,7 +411,9 @@ class GraphGridViewAdapter(GridViewAdapter):
         """
         if not pos in self.removable_cells(obj):
             raise ValueError("Cell position '%s' is not removable." % str(pos))
+        b = grid_bounds(obj)
         obj.delete_vertex(pos)
+        b.remove(pos)
         return obj
 
     def append_row(self, obj):
@@ -259,11 +429,12 @@ class GraphGridViewAdapter(GridViewAdapter):
             sage: ga.append_row(g)
             Grid Graph for [3, 2]: Graph on 8 vertices
         """
-        row_max, col_max = 0, 0
-        for t in obj.vertex_iterator():
-            row_max = max(row_max, t[0])
-            col_max = max(col_max, t[1])
-        obj.add_vertices([(row_max + 1, j) for j in range(col_max + 1)])
+        b = grid_bounds(obj)
+        row_max, col_max = b.row_max, b.col_max
+        vertices = [(row_max + 1, j) for j in range(col_max + 1)]
+        obj.add_vertices(vertices)
+        for v in vertices:
+            b.add(v)
         return obj
 
     def remove_row(self, obj, index=None):
@@ -279,11 +450,12 @@ class GraphGridViewAdapter(GridViewAdapter):
             sage: ga.remove_row(g)
             Grid Graph for [3, 2]: Graph on 4 vertices
         """
-        row_max, col_max = 0, 0
-        for t in obj.vertex_iterator():
-            row_max = max(row_max, t[0])
-            col_max = max(col_max, t[1])
-        obj.delete_vertices([(row_max, j) for j in range(col_max + 1)])
+        b = grid_bounds(obj)
+        row_max, col_max = b.row_max, b.col_max
+        vertices = [(row_max, j) for j in range(col_max + 1)]
+        obj.delete_vertices(vertices)
+        for v in vertices:
+            b.remove(v)
         return obj
 
     def append_column(self, obj):
@@ -299,11 +471,12 @@ class GraphGridViewAdapter(GridViewAdapter):
             sage: ga.append_column(g)
             Grid Graph for [3, 2]: Graph on 9 vertices
         """
-        row_max, col_max = 0, 0
-        for t in obj.vertex_iterator():
-            row_max = max(row_max, t[0])
-            col_max = max(col_max, t[1])
-        obj.add_vertices([(i, col_max + 1) for i in range(row_max + 1)])
+        b = grid_bounds(obj)
+        row_max, col_max = b.row_max, b.col_max
+        vertices = [(i, col_max + 1) for i in range(row_max + 1)]
+        obj.add_vertices(vertices)
+        for v in vertices:
+            b.add(v)
         return obj
 
     def remove_column(self, obj, index=None):
@@ -319,9 +492,10 @@ class GraphGridViewAdapter(GridViewAdapter):
             sage: ga.remove_column(g)
             Grid Graph for [3, 2]: Graph on 3 vertices
         """
-        row_max, col_max = 0, 0
-        for t in obj.vertex_iterator():
-            row_max = max(row_max, t[0])
-            col_max = max(col_max, t[1])
-        obj.delete_vertices([(i, col_max) for i in range(row_max + 1)])
+        b = grid_bounds(obj)
+        row_max, col_max = b.row_max, b.col_max
+        vertices = [(i, col_max) for i in range(row_max + 1)]
+        obj.delete_vertices(vertices)
+        for v in vertices:
+            b.remove(v)
         return obj
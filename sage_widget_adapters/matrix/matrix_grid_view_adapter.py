@@ -12,6 +12,7 @@ Grid View Adapter for matrices
     :meth:`~MatrixGridViewAdapter.display_to_cell` | Instance method for typecasting widget display value to cell content
     :meth:`~MatrixGridViewAdapter.compute_cells` | Compute matrix cells as a dictionary { coordinate pair : label }
     :meth:`~MatrixGridViewAdapter.from_cells` | Create a new matrix from a cells dictionary
+    :meth:`~MatrixGridViewAdapter.to_buffer` | Pack numeric matrix entries as one binary buffer
     :meth:`~MatrixGridViewAdapter.addable_cells` | List addable cells
     :meth:`~MatrixGridViewAdapter.removable_cells` | List removable cells
     :meth:`~MatrixGridViewAdapter.append_row` | Append a row
@@ -32,6 +33,8 @@ from itertools import product
 from sage.modules.free_module_element import vector
 from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
 from six import text_type
+from copy import copy
+MAX_SAFE_INTEGER = 2**53 - 1 # Largest integer exactly represented by a Javascript number
 
 class MatrixGridViewAdapter(GridViewAdapter):
     r"""
@@ -39,11 +42,17 @@ class MatrixGridViewAdapter(GridViewAdapter):
     """
     objclass = Matrix
     constructorname = 'matrix'
+    absorbs_dirty = True
 
-    def __init__(self, obj):
+    def __init__(self, obj, sparse=False):
         r"""
         Init an adapter object, set attributes `celltype` and `cellzero`.
 
+        In sparse mode -- with `sparse` set to ``True`` --
+        cells only hold nonzero entries. Zero entries then
+        are only editable inside an editor viewport,
+        so sparse mode is meant for large matrices seen through one.
+
         TESTS ::
 
             sage: from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
@@ -54,8 +63,18 @@ class MatrixGridViewAdapter(GridViewAdapter):
             <type 'sage.rings.rational.Rational'>
             sage: ma.cellzero
             0
+            sage: ma.sparse
+            False
+            sage: MatrixGridViewAdapter(Matrix(QQ, 3, 3, sparse=True)).sparse
+            False
+            sage: ma = MatrixGridViewAdapter(m, sparse=True)
+            sage: ma.compute_cells(m)
+            {(0, 1): 1/2, (0, 2): 1, (1, 0): 3/2, (1, 1): 2, (1, 2): 5/2, (2, 0): 3, (2, 1): 7/2, (2, 2): 4}
+            sage: ma.shape(m)
+            (3, 3)
         """
         super(MatrixGridViewAdapter, self).__init__()
+        self.sparse = sparse
         self.ring = obj.base_ring()
         try:
             self.celltype = self.ring.element_class
@@ -71,6 +90,13 @@ class MatrixGridViewAdapter(GridViewAdapter):
                 raise TypeError("Cannot determine matrix base ring elements class.")
         self.cellzero = self.ring.zero()
 
+    @classmethod
+    def for_object(cls, obj):
+        r"""
+        Return an adapter object for matrix `obj`.
+        """
+        return cls(obj)
+
     def display_to_cell(self, display_value, display_type=text_type):
         r"""
         From a widget display value `display_value`,
@@ -99,21 +125,61 @@ class MatrixGridViewAdapter(GridViewAdapter):
                     raise ValueError("Cannot cast display value %s to matrix cell" % (display_value))
         return self.cellzero
 
-    @staticmethod
-    def compute_cells(obj):
+    def compute_cells(self, obj):
         r"""
         From a matrix `obj`,
         return a dictionary { coordinates pair : cell value (as a Sage object) }
+        In sparse mode, only nonzero entries are returned.
 
         TESTS ::
 
             sage: from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
             sage: from sage.matrix.constructor import Matrix
             sage: m = Matrix(QQ, 3, 2, range(6))/2
-            sage: MatrixGridViewAdapter.compute_cells(m)
+            sage: MatrixGridViewAdapter(m).compute_cells(m)
             {(0, 0): 0, (0, 1): 1/2, (1, 0): 1, (1, 1): 3/2, (2, 0): 2, (2, 1): 5/2}
+            sage: m = Matrix(QQ, 1000, 1000, {(3, 7): 1/2}, sparse=True)
+            sage: MatrixGridViewAdapter(m, sparse=True).compute_cells(m)
+            {(3, 7): 1/2}
         """
-        return {(i,j):obj[i][j] for (i,j) in product(range(obj.nrows()), range(len(obj[0])))}
+        if self.sparse:
+            return obj.dict()
+        return dict(zip(product(range(obj.nrows()), range(obj.ncols())), obj.list()))
+
+    def display_cells(self, obj, display_type=text_type):
+        r"""
+        From a matrix `obj`, return the display values of its cells,
+        as a dictionary { coordinates pair : display value },
+        in one pass over the entries.
+        Integer matrices are converted to strings through NumPy.
+
+        TESTS ::
+
+            sage: from sage.matrix.constructor import Matrix
+            sage: from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
+            sage: m = Matrix(ZZ, 2, 2, [1, -20, 300, 0])
+            sage: MatrixGridViewAdapter(m).display_cells(m)
+            {(0, 0): '1', (0, 1): '-20', (1, 0): '300', (1, 1): '0'}
+            sage: m = Matrix(QQ, 1, 2, [1/2, 3])
+            sage: MatrixGridViewAdapter(m).display_cells(m)
+            {(0, 0): '1/2', (0, 1): '3'}
+        """
+        if self.sparse:
+            return {pos: self.cell_to_display(val, display_type) for pos, val in obj.dict().items()}
+        positions = product(range(obj.nrows()), range(obj.ncols()))
+        if display_type is not text_type:
+            return dict(zip(positions, obj.list()))
+        from sage.rings.integer_ring import ZZ
+        if self.ring is ZZ and obj.nrows() and obj.ncols() and obj.height() < 2**63:
+            return dict(zip(positions, obj.numpy(dtype='int64').ravel().astype(str).tolist()))
+        return dict(zip(positions, map(str, obj.list())))
+
+    def shape(self, obj):
+        r"""
+        In sparse mode, return the matrix dimensions.
+        """
+        if self.sparse:
+            return (obj.nrows(), obj.ncols())
 
     @classmethod
     def from_cells(cls, cells={}):
@@ -133,6 +199,112 @@ class MatrixGridViewAdapter(GridViewAdapter):
         ncols = max([pos[1]+1 for pos in cells])
         return matrix([[cells[(i,j)] for j in range(ncols)] for i in range(nrows)])
 
+    def set_cell(self, obj, pos, val, dirty={}, constructorname=''):
+        r"""
+        From a matrix `obj`, a position `pos` and a value `val`,
+        return a copy of `obj`, in the same parent,
+        with entry `val` at position `pos` (and dirty values set, if any).
+        Return an exception if a value does not belong to the base ring.
+
+        TESTS ::
+
+            sage: from sage.matrix.constructor import Matrix
+            sage: from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
+            sage: m = Matrix(QQ, 3, 3, range(9))/2
+            sage: ma = MatrixGridViewAdapter(m)
+            sage: ma.set_cell(m, (0,1), 2/3)
+            [  0 2/3   1]
+            [3/2   2 5/2]
+            [  3 7/2   4]
+            sage: ma.set_cell(m, (0,1), 2/3, {(2,2): 1})
+            [  0 2/3   1]
+            [3/2   2 5/2]
+            [  3 7/2   1]
+            sage: m[0,1]
+            1/2
+            sage: n = Matrix(ZZ, 2, 2, range(4))
+            sage: MatrixGridViewAdapter(n).set_cell(n, (1,1), 1/2)
+            TypeError('no conversion of this rational to integer')
+            sage: ma.set_cell(m, (4,2), 1/2)
+            Traceback (most recent call last):
+            ...
+            ValueError: Position '(4, 2)' does not exist
+        """
+        if constructorname:
+            return super(MatrixGridViewAdapter, self).set_cell(obj, pos, val, dirty, constructorname)
+        if not (0 <= pos[0] < obj.nrows() and 0 <= pos[1] < obj.ncols()):
+            raise ValueError("Position '%s' does not exist" % str(pos))
+        m = copy(obj) # A mutable copy
+        try:
+            for p in sorted(dirty):
+                if p != pos:
+                    m[p] = dirty[p]
+            m[pos] = val
+        except Exception as e:
+            return e
+        return m
+
+    def to_buffer(self, obj):
+        r"""
+        From a numeric matrix `obj`, return its entries
+        packed as one little-endian binary buffer, in row-major order.
+
+        OUTPUT: a pair `(dtype, bytes)` where `dtype` is 'int64', 'float64'
+        or 'rational' (numerators then denominators, as int64),
+        or None if entries cannot be packed.
+
+        TESTS ::
+
+            sage: import numpy
+            sage: from sage.matrix.constructor import Matrix
+            sage: from sage_widget_adapters.matrix.matrix_grid_view_adapter import MatrixGridViewAdapter
+            sage: m = Matrix(ZZ, 2, 2, [1, -2, 3, 4])
+            sage: ma = MatrixGridViewAdapter(m)
+            sage: dtype, buf = ma.to_buffer(m)
+            sage: dtype, numpy.frombuffer(buf, dtype='<i8')
+            ('int64', array([ 1, -2,  3,  4]))
+            sage: ma.to_buffer(Matrix(ZZ, 1, 1, [2^70])) is None
+            True
+            sage: m = Matrix(QQ, 1, 2, [1/2, 3])
+            sage: dtype, buf = MatrixGridViewAdapter(m).to_buffer(m)
+            sage: dtype, numpy.frombuffer(buf, dtype='<i8')
+            ('rational', array([1, 3, 2, 1]))
+            sage: m = Matrix(GF(7), 1, 2, [3, -1])
+            sage: dtype, buf = MatrixGridViewAdapter(m).to_buffer(m)
+            sage: dtype, numpy.frombuffer(buf, dtype='<i8')
+            ('int64', array([3, 6]))
+            sage: m = Matrix(RDF, 1, 2, [0.5, 2.25])
+            sage: dtype, buf = MatrixGridViewAdapter(m).to_buffer(m)
+            sage: dtype, numpy.frombuffer(buf, dtype='<f8')
+            ('float64', array([0.5 , 2.25]))
+            sage: R = PolynomialRing(QQ, 'x')
+            sage: m = Matrix(R, 1, 1, [R.gen()])
+            sage: MatrixGridViewAdapter(m).to_buffer(m) is None
+            True
+        """
+        from sage.rings.integer_ring import ZZ
+        from sage.rings.rational_field import QQ
+        from sage.rings.real_double import RDF
+        from sage.rings.real_mpfr import RR
+        from sage.rings.finite_rings.integer_mod_ring import IntegerModRing_generic
+        entries = obj.list()
+        if self.ring is ZZ:
+            dtype, values = 'int64', [int(x) for x in entries]
+        elif isinstance(self.ring, IntegerModRing_generic):
+            dtype, values = 'int64', [int(x.lift()) for x in entries]
+        elif self.ring is QQ:
+            dtype = 'rational'
+            values = [int(x.numerator()) for x in entries] + [int(x.denominator()) for x in entries]
+        elif self.ring is RDF or self.ring is RR:
+            import numpy
+            return 'float64', numpy.array([float(x) for x in entries], dtype='<f8').tobytes()
+        else:
+            return
+        if values and max(abs(v) for v in values) > MAX_SAFE_INTEGER:
+            return
+        import numpy
+        return dtype, numpy.array(values, dtype='<i8').tobytes()
+
     @staticmethod
     def addable_cells(obj):
         r"""
@@ -244,9 +416,13 @@ class MatrixGridViewAdapter(GridViewAdapter):
                 r = r[:obj.ncols()]
             elif len(r) < obj.ncols():
                 r = list(r) + [self.cellzero] * (obj.ncols() - len(r))
-        top = obj.matrix_from_rows(range(index))
-        bottom = obj.matrix_from_rows(range(index,obj.nrows()))
-        return top.stack(vector([self.display_to_cell(x) for x in r])).stack(bottom)
+        r = [self.display_to_cell(x) for x in r]
+        if not obj.nrows():
+            return obj.new_matrix(nrows=1, entries=r)
+        # One copy, with a placeholder row at `index`
+        m = obj.matrix_from_rows(list(range(index)) + [0] + list(range(index, obj.nrows())))
+        m.set_row(index, r)
+        return m
 
     def remove_row(self, obj, index=None):
         r"""
@@ -335,9 +511,13 @@ class MatrixGridViewAdapter(GridViewAdapter):
                 c = c[:obj.nrows()]
             elif len(c) < obj.nrows():
                 c = list(c) + [self.cellzero] * (obj.nrows() - len(c))
-        left = obj.matrix_from_columns(range(index))
-        right = obj.matrix_from_columns(range(index,obj.ncols()))
-        return left.augment(vector([self.display_to_cell(x) for x in c])).augment(right)
+        c = [self.display_to_cell(x) for x in c]
+        if not obj.ncols():
+            return obj.new_matrix(ncols=1, entries=c)
+        # One copy, with a placeholder column at `index`
+        m = obj.matrix_from_columns(list(range(index)) + [0] + list(range(index, obj.ncols())))
+        m.set_column(index, c)
+        return m
 
     def remove_column(self, obj, index=None):
         r"""
@@ -363,4 +543,4 @@ class MatrixGridViewAdapter(GridViewAdapter):
         """
         if index is None:
             index = obj.ncols() - 1
-        return obj.delete_columns([index])
+        return obj.matrix_from_columns([j for j in range(obj.ncols()) if j != index])
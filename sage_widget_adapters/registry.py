@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+r"""
+Adapter registry
+
+Adapters are registered for object classes. A class is given either
+as a class or as its dotted path (e.g. ``'sage.combinat.partition.Partition'``);
+an adapter is given either as an adapter class or as a ``'module:Class'`` string,
+so that its module is only imported when first matched.
+An object's adapter is the one registered for the first class
+of its method resolution order. Lookups are memoized per class.
+
+Third-party packages can register adapters through the
+``sage_widget_adapters`` entry point group, with the dotted path
+of the object class as the entry point name, e.g. ::
+
+    entry_points = {
+        'sage_widget_adapters': [
+            'sage.combinat.permutation.Permutation = mypackage.adapters:PermutationGridViewAdapter',
+        ],
+    }
+
+EXAMPLES ::
+
+    sage: from sage_widget_adapters.registry import adapter_class
+    sage: adapter_class(Partition([3, 1]).__class__)
+    <class 'sage_widget_adapters.combinat.partition_grid_view_adapter.PartitionGridViewAdapter'>
+    sage: adapter_class(StandardTableau([[1, 2], [3]]).__class__)
+    <class 'sage_widget_adapters.combinat.tableau_grid_view_adapter.StandardTableauGridViewAdapter'>
+    sage: adapter_class(vector((1, 2, 3)).__class__) is None
+    True
+
+AUTHORS ::
+
+    Odile Bénassy, Nicolas Thiéry
+
+"""
+from importlib import import_module
+
+ENTRY_POINT_GROUP = 'sage_widget_adapters'
+
+_adapters = {
+    'sage.combinat.partition.Partition':
+        'sage_widget_adapters.combinat.partition_grid_view_adapter:PartitionGridViewAdapter',
+    'sage.combinat.skew_partition.SkewPartition':
+        'sage_widget_adapters.combinat.skew_partition_grid_view_adapter:SkewPartitionGridViewAdapter',
+    'sage.combinat.tableau.Tableau':
+        'sage_widget_adapters.combinat.tableau_grid_view_adapter:TableauGridViewAdapter',
+    'sage.combinat.tableau.SemistandardTableau':
+        'sage_widget_adapters.combinat.tableau_grid_view_adapter:SemistandardTableauGridViewAdapter',
+    'sage.combinat.tableau.StandardTableau':
+        'sage_widget_adapters.combinat.tableau_grid_view_adapter:StandardTableauGridViewAdapter',
+    'sage.combinat.skew_tableau.SkewTableau':
+        'sage_widget_adapters.combinat.skew_tableau_grid_view_adapter:SkewTableauGridViewAdapter',
+    'sage.combinat.parallelogram_polyomino.ParallelogramPolyomino':
+        'sage_widget_adapters.combinat.parallelogram_polyomino_grid_view_adapter:ParallelogramPolyominoGridViewAdapter',
+    'sage.matrix.matrix2.Matrix':
+        'sage_widget_adapters.matrix.matrix_grid_view_adapter:MatrixGridViewAdapter',
+    'sage.graphs.graph.Graph':
+        'sage_widget_adapters.graphs.graph_grid_view_adapter:GraphGridViewAdapter',
+}
+_resolved = {} # object class -> adapter class, or None
+_entry_points_loaded = False
+
+
+def _class_path(cls):
+    return "%s.%s" % (cls.__module__, cls.__name__)
+
+def _load_spec(spec):
+    r"""
+    From a ``'module:Class'`` string, import and return the class.
+    Other values are returned as they are.
+    """
+    if not isinstance(spec, str):
+        return spec
+    module_name, _, attr = spec.partition(':')
+    obj = import_module(module_name)
+    for name in attr.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+def _iter_entry_points():
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            from pkg_resources import iter_entry_points
+        except ImportError:
+            return []
+        return list(iter_entry_points(ENTRY_POINT_GROUP))
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=ENTRY_POINT_GROUP))
+    return list(eps.get(ENTRY_POINT_GROUP, []))
+
+def load_entry_points():
+    r"""
+    Register adapters declared by installed packages.
+    Only entry point names and values are read:
+    adapter modules are imported when first matched.
+    Explicit registrations take precedence.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for ep in _iter_entry_points():
+        value = getattr(ep, 'value', None)
+        if value is None: # pkg_resources
+            value = "%s:%s" % (ep.module_name, '.'.join(ep.attrs))
+        _adapters.setdefault(ep.name, value)
+    _resolved.clear()
+
+def register_adapter(objclass, adapter):
+    r"""
+    Register `adapter` for objects of class `objclass`.
+
+    INPUT:
+
+        - ``objclass`` -- a class, or its dotted path
+        - ``adapter`` -- an adapter class, or a ``'module:Class'`` string
+
+    TESTS ::
+
+        sage: from sage_widget_adapters.registry import register_adapter, adapter_class
+        sage: from sage_widget_adapters.generic_grid_view_adapter import GridViewAdapter
+        sage: class PermutationGridViewAdapter(GridViewAdapter):
+        ....:     pass
+        sage: register_adapter('sage.combinat.permutation.Permutation', PermutationGridViewAdapter)
+        sage: adapter_class(Permutation([2, 1]).__class__) is PermutationGridViewAdapter
+        True
+    """
+    if not isinstance(objclass, str):
+        objclass = _class_path(objclass)
+    _adapters[objclass] = adapter
+    _resolved.clear()
+
+def adapter_class(cls):
+    r"""
+    Return the adapter class registered for class `cls`
+    or its closest ancestor, or ``None``.
+    """
+    try:
+        return _resolved[cls]
+    except KeyError:
+        pass
+    load_entry_points()
+    result = None
+    for c in cls.__mro__:
+        path = _class_path(c)
+        if path in _adapters:
+            result = _adapters[path] = _load_spec(_adapters[path])
+            break
+    _resolved[cls] = result
+    return result